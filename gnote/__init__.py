@@ -1,24 +1,49 @@
 """gnote - Simplified Git-based context management for LLM agents via MCP."""
 
-from gnote.config import GnoteConfig, TokenApproach
-from gnote.config_manager import ConfigManager
-from gnote.git_manager import (
-    CommitInfo,
-    GitNoteManager,
-    History,
-    Search,
-    Snapshot,
-)
-from gnote.mcp import (
-    AppendNoteResult,
-    HistoryResult,
-    ReadNoteResult,
-    SearchResult,
-    SnapshotResult,
-    UpdateNoteResult,
-    setup_mcp,
-)
-from gnote.token_counter import TokenCounter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gnote.config import GnoteConfig, TokenApproach
+    from gnote.config_manager import ConfigManager
+    from gnote.git_manager import (
+        CommitInfo,
+        GitNoteManager,
+        History,
+        Search,
+        Snapshot,
+    )
+    from gnote.mcp import (
+        AppendNoteResult,
+        HistoryResult,
+        ReadNoteResult,
+        SearchResult,
+        SnapshotResult,
+        UpdateNoteResult,
+        setup_mcp,
+    )
+    from gnote.token_counter import TokenCounter
+
+# Public names are imported on first access so that `gnote.cli` does not pay
+# for the MCP SDK and GitPython imports on commands that never use them.
+_EXPORTS: dict[str, str] = {
+    "GnoteConfig": "gnote.config",
+    "TokenApproach": "gnote.config",
+    "ConfigManager": "gnote.config_manager",
+    "GitNoteManager": "gnote.git_manager",
+    "TokenCounter": "gnote.token_counter",
+    "CommitInfo": "gnote.git_manager",
+    "History": "gnote.git_manager",
+    "Snapshot": "gnote.git_manager",
+    "Search": "gnote.git_manager",
+    "setup_mcp": "gnote.mcp",
+    "ReadNoteResult": "gnote.mcp",
+    "UpdateNoteResult": "gnote.mcp",
+    "AppendNoteResult": "gnote.mcp",
+    "HistoryResult": "gnote.mcp",
+    "SnapshotResult": "gnote.mcp",
+    "SearchResult": "gnote.mcp",
+}
 
 __all__ = [
     "GnoteConfig",
@@ -38,3 +63,12 @@ __all__ = [
     "SnapshotResult",
     "SearchResult",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import public names lazily on first attribute access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'gnote' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
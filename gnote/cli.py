@@ -1,15 +1,18 @@
 """CLI commands for gnote."""
 
 import argparse
+import functools
 import json
-import re
+import os
+import string
 import sys
+from collections.abc import Callable
+from pathlib import Path
 
-from pydantic import ValidationError
-
-from gnote.config import GnoteConfig
 from gnote.config_manager import ConfigManager
-from gnote.git_manager import GitNoteManager
+
+_BRANCH_CHARS = frozenset(string.ascii_letters + string.digits + "._/-")
+_STDIN_CHUNK_SIZE = 128 * 1024
 
 
 def validate_branch_name(branch: str) -> str:
@@ -19,13 +22,13 @@ def validate_branch_name(branch: str) -> str:
     if len(branch) > 255:
         raise ValueError("Branch name too long (max 255 characters)")
 
-    if not re.match(r"^[a-zA-Z0-9._/-]+$", branch):
+    if not _BRANCH_CHARS.issuperset(branch):
         raise ValueError(
             "Branch name must contain only letters, numbers, dots, "
             "underscores, hyphens, and forward slashes"
         )
 
-    if ".." in branch or branch.startswith("/") or branch.startswith("."):
+    if branch[0] in "./" or ".." in branch:
         raise ValueError("Branch name cannot contain '..' or start with '/' or '.'")
 
     if branch.lower() in ("head",) and branch != branch.lower():
@@ -34,26 +37,60 @@ def validate_branch_name(branch: str) -> str:
     return branch
 
 
+def _branch_name_arg(value: str) -> str:
+    """Argparse type that validates branch names at parse time."""
+    try:
+        return validate_branch_name(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid branch name: {e}") from e
+
+
+def _read_stdin() -> str:
+    """Read all of stdin as UTF-8 in fixed-size binary chunks.
+
+    Decodes once at the end instead of incrementally through the text layer.
+    Line endings are normalized as the text layer would. Streams without a
+    binary buffer (e.g. a substituted StringIO) are read as text.
+    """
+    stream = getattr(sys.stdin, "buffer", None)
+    if stream is None:
+        return sys.stdin.read()
+    buf = bytearray()
+    while chunk := stream.read(_STDIN_CHUNK_SIZE):
+        buf.extend(chunk)
+    return buf.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+@functools.lru_cache(maxsize=1)
+def _active_branch(repo_path: Path) -> str:
+    """Get the active branch of the repository at repo_path.
+
+    Cached so a CLI invocation resolves HEAD at most once. Commands that
+    switch branches must call _active_branch.cache_clear().
+    """
+    from gnote.git_manager import GitNoteManager
+
+    return GitNoteManager.get_active_branch()
+
+
 def cmd_init(args: argparse.Namespace) -> None:
     """Initialize gnote structure.
 
     CLI: gnote init <branch>
     """
-    try:
-        branch: str = validate_branch_name(args.branch)
-    except ValueError as e:
-        print(f"✗ Invalid branch name: {e}", file=sys.stderr)
-        sys.exit(1)
+    from gnote.git_manager import GitNoteManager
+
+    branch: str = args.branch
 
-    ConfigManager.GNOTE_HOME.mkdir(parents=True, exist_ok=True)
-    (ConfigManager.GNOTE_HOME / "configs").mkdir(exist_ok=True)
-    (ConfigManager.GNOTE_HOME / "logs").mkdir(exist_ok=True)
+    for subdir in ("configs", "logs"):
+        (ConfigManager.GNOTE_HOME / subdir).mkdir(parents=True, exist_ok=True)
 
     ConfigManager.initialize_default()
 
     try:
         GitNoteManager(branch)
         GitNoteManager.checkout_branch(branch)
+        _active_branch.cache_clear()
         print("✓ gnote initialized at ~/.gnote")
         print("  - Repository created at ~/.gnote/repo")
         print(f"  - Default config created at ~/.gnote/{ConfigManager.GLOBAL_CONFIG_FILE}")
@@ -69,8 +106,8 @@ def cmd_config_show(args: argparse.Namespace) -> None:
     CLI: gnote config
     """
     try:
-        branch = GitNoteManager.get_active_branch()
-        config = ConfigManager.load_for_branch(branch)
+        branch = _active_branch(ConfigManager.REPO_PATH)
+        config = ConfigManager.load_for_branch_unvalidated(branch)
 
         print(f"# Configuration for branch: {branch}")
         print(config.model_dump_json(indent=2))
@@ -85,42 +122,27 @@ def cmd_config_set(args: argparse.Namespace) -> None:
 
     CLI: gnote config set <key> <value>
     """
+    from pydantic import ValidationError
+
+    from gnote.config import CONFIG_KEYS, GnoteConfig
+
     try:
         key: str = args.key
         raw_value: str = args.value
 
-        branch = GitNoteManager.get_active_branch()
-        current_config = ConfigManager.load_for_branch(branch)
+        branch = _active_branch(ConfigManager.REPO_PATH)
         overrides = ConfigManager.get_branch_override(branch)
 
-        if key not in GnoteConfig.model_fields:
-            valid_keys = ", ".join(GnoteConfig.model_fields.keys())
+        if key not in CONFIG_KEYS:
+            valid_keys = ", ".join(sorted(CONFIG_KEYS))
             print(f"✗ Unknown config key: {key}", file=sys.stderr)
             print(f"  Valid keys: {valid_keys}", file=sys.stderr)
             sys.exit(1)
 
-        field_info = GnoteConfig.model_fields[key]
-        parsed_value: str | int
-
         try:
-            if field_info.annotation is int:
-                parsed_value = int(raw_value)
-            else:
-                parsed_value = raw_value
-
-            test_config_data = current_config.model_dump()
-            test_config_data[key] = parsed_value
-            GnoteConfig(**test_config_data)
-
+            parsed_value = GnoteConfig.validate_field(key, raw_value)
         except ValidationError as e:
-            errors = e.errors()
-            for error in errors:
-                if key in str(error["loc"]):
-                    print(f"✗ Invalid value for {key}: {error['msg']}", file=sys.stderr)
-                    sys.exit(1)
-            raise
-        except ValueError as e:
-            print(f"✗ Invalid value for {key}: {e}", file=sys.stderr)
+            print(f"✗ Invalid value for {key}: {e.errors()[0]['msg']}", file=sys.stderr)
             sys.exit(1)
 
         overrides[key] = parsed_value
@@ -138,7 +160,7 @@ def cmd_branch_show(args: argparse.Namespace) -> None:
     CLI: gnote branch
     """
     try:
-        branch = GitNoteManager.get_active_branch()
+        branch = _active_branch(ConfigManager.REPO_PATH)
         print(branch)
     except Exception as e:
         print(f"✗ Failed to get current branch: {e}", file=sys.stderr)
@@ -150,13 +172,14 @@ def cmd_branch_list(args: argparse.Namespace) -> None:
 
     CLI: gnote branch list
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
-        current = GitNoteManager.get_active_branch()
+        current = _active_branch(ConfigManager.REPO_PATH)
         branches = GitNoteManager.list_branches()
 
-        for branch in branches:
-            marker = "*" if branch == current else " "
-            print(f"{marker} {branch}")
+        lines = [f"{'*' if branch == current else ' '} {branch}\n" for branch in branches]
+        sys.stdout.writelines(lines)
 
     except Exception as e:
         print(f"✗ Failed to list branches: {e}", file=sys.stderr)
@@ -168,16 +191,16 @@ def cmd_branch_create(args: argparse.Namespace) -> None:
 
     CLI: gnote branch create <name> [--from <branch>]
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
-        name: str = validate_branch_name(args.name)
+        name: str = args.name
         from_branch: str | None = args.from_branch
-        if from_branch:
-            from_branch = validate_branch_name(from_branch)
 
-        current = GitNoteManager.get_active_branch()
+        current = _active_branch(ConfigManager.REPO_PATH)
         with GitNoteManager(current) as manager:
             sha = manager.create_branch(name, from_branch)
-            print(f"✓ Created branch '{name}' at {sha[:8]}")
+            print(f"✓ Created branch '{name}' at {sha:.8s}")
 
     except Exception as e:
         print(f"✗ Failed to create branch: {e}", file=sys.stderr)
@@ -189,10 +212,13 @@ def cmd_branch_checkout(args: argparse.Namespace) -> None:
 
     CLI: gnote branch checkout <name>
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
-        name: str = validate_branch_name(args.name)
+        name: str = args.name
 
         GitNoteManager.checkout_branch(name)
+        _active_branch.cache_clear()
         print(f"✓ Switched to branch '{name}'")
 
     except Exception as e:
@@ -205,8 +231,10 @@ def cmd_read(args: argparse.Namespace) -> None:
 
     CLI: gnote read
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
-        branch = GitNoteManager.get_active_branch()
+        branch = _active_branch(ConfigManager.REPO_PATH)
         with GitNoteManager(branch) as manager:
             content = manager.read_note()
             print(content)
@@ -222,20 +250,22 @@ def cmd_update(args: argparse.Namespace) -> None:
     CLI: gnote update <message> --content <text>
           gnote update <message>  (reads from stdin)
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
         message: str = args.message
         content_arg: str | None = args.content
 
-        branch = GitNoteManager.get_active_branch()
+        branch = _active_branch(ConfigManager.REPO_PATH)
         with GitNoteManager(branch) as manager:
             if content_arg:
                 content = content_arg
             else:
                 print("Enter new note (Ctrl+D or Ctrl+Z to finish):")
-                content = sys.stdin.read()
+                content = _read_stdin()
 
             sha = manager.write_note(content, message)
-            print(f"✓ Updated note: {sha[:8]}")
+            print(f"✓ Updated note: {sha:.8s}")
 
     except Exception as e:
         print(f"✗ Failed to update note: {e}", file=sys.stderr)
@@ -248,20 +278,22 @@ def cmd_append(args: argparse.Namespace) -> None:
     CLI: gnote append <message> --text <text>
           gnote append <message>  (reads from stdin)
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
         message: str = args.message
         text_arg: str | None = args.text
 
-        branch = GitNoteManager.get_active_branch()
+        branch = _active_branch(ConfigManager.REPO_PATH)
         with GitNoteManager(branch) as manager:
             if text_arg:
                 text = text_arg
             else:
                 print("Enter text to append (Ctrl+D or Ctrl+Z to finish):")
-                text = sys.stdin.read()
+                text = _read_stdin()
 
             sha = manager.append_note(text, message)
-            print(f"✓ Appended to note: {sha[:8]}")
+            print(f"✓ Appended to note: {sha:.8s}")
 
     except Exception as e:
         print(f"✗ Failed to append to note: {e}", file=sys.stderr)
@@ -273,26 +305,26 @@ def cmd_history(args: argparse.Namespace) -> None:
 
     CLI: gnote history [--limit N] [--starting-after SHA]
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
         limit: int = args.limit
         starting_after: str | None = args.starting_after
 
-        branch = GitNoteManager.get_active_branch()
+        branch = _active_branch(ConfigManager.REPO_PATH)
         with GitNoteManager(branch) as manager:
             result = manager.get_history(limit, starting_after)
 
-            print(f"# History ({len(result.commits)} of {result.total_commits} commits)")
-            print()
+            lines = [f"# History ({len(result.commits)} of {result.total_commits} commits)\n\n"]
 
             for commit in result.commits:
-                sha_short = commit.sha[:8]
-                print(f"{sha_short} - {commit.timestamp}")
-                print(f"  {commit.message}")
-                print()
+                lines.append(f"{commit.sha:.8s} - {commit.timestamp}\n  {commit.message}\n\n")
 
             if result.has_more:
                 last_sha = result.commits[-1].sha
-                print(f"# More commits available. Use: --starting-after {last_sha}")
+                lines.append(f"# More commits available. Use: --starting-after {last_sha}\n")
+
+            sys.stdout.writelines(lines)
 
     except Exception as e:
         print(f"✗ Failed to get history: {e}", file=sys.stderr)
@@ -304,10 +336,12 @@ def cmd_snapshot(args: argparse.Namespace) -> None:
 
     CLI: gnote snapshot <sha>
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
         sha: str = args.sha
 
-        branch = GitNoteManager.get_active_branch()
+        branch = _active_branch(ConfigManager.REPO_PATH)
         with GitNoteManager(branch) as manager:
             snapshot = manager.get_snapshot(sha)
 
@@ -327,23 +361,25 @@ def cmd_search(args: argparse.Namespace) -> None:
 
     CLI: gnote search <keyword> [keyword...] [--limit N]
     """
+    from gnote.git_manager import GitNoteManager
+
     try:
         keywords: list[str] = args.keywords
         limit: int = args.limit
 
-        branch = GitNoteManager.get_active_branch()
+        branch = _active_branch(ConfigManager.REPO_PATH)
         with GitNoteManager(branch) as manager:
             result = manager.search_history(keywords, limit)
 
-            print(f"# Searched {limit} commits for: {', '.join(keywords)}")
-            print(f"# Found {result.total_matches} matches")
-            print()
+            lines = [
+                f"# Searched {limit} commits for: {', '.join(keywords)}\n",
+                f"# Found {result.total_matches} matches\n\n",
+            ]
 
             for commit in result.commits:
-                sha_short = commit.sha[:8]
-                print(f"{sha_short} - {commit.timestamp}")
-                print(f"  {commit.message}")
-                print()
+                lines.append(f"{commit.sha:.8s} - {commit.timestamp}\n  {commit.message}\n\n")
+
+            sys.stdout.writelines(lines)
 
     except Exception as e:
         print(f"✗ Failed to search history: {e}", file=sys.stderr)
@@ -357,36 +393,47 @@ def cmd_validate(args: argparse.Namespace) -> None:
     """
     errors = []
 
-    if not ConfigManager.GNOTE_HOME.exists():
+    try:
+        # One scan of the home directory answers the subdirectory checks;
+        # DirEntry.is_dir() uses the type recorded by the scan where available.
+        with os.scandir(ConfigManager.GNOTE_HOME) as it:
+            home_dirs = {entry.name for entry in it if entry.is_dir()}
+    except FileNotFoundError:
         errors.append("~/.gnote directory does not exist. Run 'gnote init' first.")
+    except OSError as e:
+        errors.append(f"~/.gnote is not a readable directory: {e.strerror}")
     else:
         print("✓ ~/.gnote directory exists")
 
-        config_path = ConfigManager.GNOTE_HOME / ConfigManager.GLOBAL_CONFIG_FILE
-        if not config_path.exists():
+        config_path = ConfigManager.global_config_path()
+        try:
+            raw_config = config_path.read_bytes()
+        except FileNotFoundError:
             errors.append(f"~/.gnote/{ConfigManager.GLOBAL_CONFIG_FILE} does not exist")
+        except OSError as e:
+            errors.append(
+                f"~/.gnote/{ConfigManager.GLOBAL_CONFIG_FILE} cannot be read: {e.strerror}"
+            )
         else:
             print(f"✓ ~/.gnote/{ConfigManager.GLOBAL_CONFIG_FILE} exists")
             try:
-                with config_path.open() as f:
-                    json.load(f)
+                json.loads(raw_config)
                 print(f"✓ {ConfigManager.GLOBAL_CONFIG_FILE} is valid JSON")
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 errors.append(f"~/.gnote/{ConfigManager.GLOBAL_CONFIG_FILE} is not valid JSON")
 
-        if not ConfigManager.REPO_PATH.exists():
+        if not ConfigManager.REPO_PATH.is_dir():
             errors.append("~/.gnote/repo does not exist")
         else:
             print("✓ ~/.gnote/repo exists")
             try:
-                branch = GitNoteManager.get_active_branch()
+                branch = _active_branch(ConfigManager.REPO_PATH)
                 print(f"✓ Current branch: {branch}")
             except Exception as e:
                 errors.append(f"Git repository error: {e}")
 
         for subdir in ["configs", "logs"]:
-            path = ConfigManager.GNOTE_HOME / subdir
-            if not path.exists():
+            if subdir not in home_dirs:
                 errors.append(f"~/.gnote/{subdir} does not exist")
             else:
                 print(f"✓ ~/.gnote/{subdir} exists")
@@ -403,7 +450,7 @@ def cmd_validate(args: argparse.Namespace) -> None:
 def cmd_repair(args: argparse.Namespace) -> None:
     """Verify and repair gnote repository integrity.
 
-    CLI: gnote repair
+    CLI: gnote repair [--deep]
     """
     try:
         issues_found = []
@@ -414,11 +461,12 @@ def cmd_repair(args: argparse.Namespace) -> None:
             print("✓ Created ~/.gnote directory")
 
         for subdir in ["configs", "logs"]:
-            path = ConfigManager.GNOTE_HOME / subdir
-            if not path.exists():
-                issues_found.append(f"~/.gnote/{subdir} missing")
-                path.mkdir(exist_ok=True)
-                print(f"✓ Created ~/.gnote/{subdir}")
+            try:
+                (ConfigManager.GNOTE_HOME / subdir).mkdir()
+            except FileExistsError:
+                continue
+            issues_found.append(f"~/.gnote/{subdir} missing")
+            print(f"✓ Created ~/.gnote/{subdir}")
 
         if not ConfigManager.REPO_PATH.exists():
             issues_found.append("Git repository missing")
@@ -429,11 +477,14 @@ def cmd_repair(args: argparse.Namespace) -> None:
             from git import Repo
 
             repo = Repo(ConfigManager.REPO_PATH)
+            branches = [ref.name for ref in repo.heads]
 
-            repo.git.fsck()
-            print("✓ Git repository integrity check passed")
+            if args.deep or not (branches and repo.head.is_valid()):
+                repo.git.fsck()
+                print("✓ Git repository integrity check passed")
+            else:
+                print("✓ Git repository quick-check passed (run with --deep for fsck)")
 
-            branches = [ref.name for ref in repo.heads]
             print(f"✓ Found {len(branches)} branches: {', '.join(branches)}")
 
         except Exception as e:
@@ -452,13 +503,31 @@ def cmd_repair(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+# Argument-free invocations dispatched without building the argparse tree.
+# Namespace values must match the parser defaults in main().
+_FAST_COMMANDS: dict[tuple[str, ...], tuple[Callable[[argparse.Namespace], None], dict]] = {
+    ("read",): (cmd_read, {}),
+    ("branch",): (cmd_branch_show, {}),
+    ("branch", "list"): (cmd_branch_list, {}),
+    ("config",): (cmd_config_show, {}),
+    ("history",): (cmd_history, {"limit": 10, "starting_after": None}),
+    ("validate",): (cmd_validate, {}),
+}
+
+
 def main() -> None:
     """Main CLI entry point."""
+    fast = _FAST_COMMANDS.get(tuple(sys.argv[1:]))
+    if fast is not None:
+        func, defaults = fast
+        func(argparse.Namespace(**defaults))
+        return
+
     parser = argparse.ArgumentParser(description="gnote - Git-based note management for LLM agents")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     parser_init = subparsers.add_parser("init", help="Initialize gnote")
-    parser_init.add_argument("branch", help="Initial branch name")
+    parser_init.add_argument("branch", type=_branch_name_arg, help="Initial branch name")
     parser_init.set_defaults(func=cmd_init)
 
     parser_config = subparsers.add_parser("config", help="Manage configuration")
@@ -480,14 +549,17 @@ def main() -> None:
     parser_branch_list.set_defaults(func=cmd_branch_list)
 
     parser_branch_create = branch_subparsers.add_parser("create", help="Create new branch")
-    parser_branch_create.add_argument("name", help="Branch name")
+    parser_branch_create.add_argument("name", type=_branch_name_arg, help="Branch name")
     parser_branch_create.add_argument(
-        "--from", dest="from_branch", help="Source branch (default: current)"
+        "--from",
+        dest="from_branch",
+        type=_branch_name_arg,
+        help="Source branch (default: current)",
     )
     parser_branch_create.set_defaults(func=cmd_branch_create)
 
     parser_branch_checkout = branch_subparsers.add_parser("checkout", help="Checkout branch")
-    parser_branch_checkout.add_argument("name", help="Branch name")
+    parser_branch_checkout.add_argument("name", type=_branch_name_arg, help="Branch name")
     parser_branch_checkout.set_defaults(func=cmd_branch_checkout)
 
     parser_read = subparsers.add_parser("read", help="Read current note")
@@ -521,6 +593,9 @@ def main() -> None:
     parser_validate.set_defaults(func=cmd_validate)
 
     parser_repair = subparsers.add_parser("repair", help="Verify and repair repository")
+    parser_repair.add_argument(
+        "--deep", action="store_true", help="Always run a full git fsck of the repository"
+    )
     parser_repair.set_defaults(func=cmd_repair)
 
     args = parser.parse_args()
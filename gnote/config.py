@@ -1,8 +1,10 @@
 """Configuration data model for gnote."""
 
+import functools
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class TokenApproach(str, Enum):
@@ -21,3 +23,33 @@ class GnoteConfig(BaseModel):
 
     token_approach: TokenApproach = Field(default=TokenApproach.CHARDIV4)
     token_limit: int = Field(default=8000, gt=0)
+
+    @classmethod
+    def validate_field(cls, name: str, value: str | int) -> str | int:
+        """Validate a single field value without building a whole config.
+
+        Args:
+            name: Field name
+            value: Raw value, coerced to the field type
+
+        Returns:
+            Validated value in JSON-compatible form
+
+        Raises:
+            KeyError: If name is not a config field
+            ValidationError: If the value is invalid for the field
+        """
+        adapter = _field_adapter(name)
+        return adapter.dump_python(adapter.validate_python(value), mode="json")
+
+
+CONFIG_KEYS: frozenset[str] = frozenset(GnoteConfig.model_fields)
+
+
+@functools.cache
+def _field_adapter(name: str) -> TypeAdapter[str | int]:
+    """Build and cache a validator for a single GnoteConfig field."""
+    field = GnoteConfig.model_fields[name]
+    if field.metadata:
+        return TypeAdapter(Annotated[field.annotation, *field.metadata])
+    return TypeAdapter(field.annotation)
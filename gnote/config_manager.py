@@ -1,9 +1,54 @@
-"""Configuration file management for gnote."""
+"""Configuration file management for gnote.
 
+Config files are parsed with orjson when it is installed (the ``orjson``
+extra), falling back to the standard library json module otherwise. Both
+write the same bytes for config data.
+"""
+
+import functools
 import json
 from pathlib import Path
 
-from gnote.config import GnoteConfig
+from gnote.config import GnoteConfig, TokenApproach
+
+
+def _json_loads(data: bytes) -> dict[str, str | int]:
+    return json.loads(data)
+
+
+def _json_dumps(obj: dict[str, str | int]) -> bytes:
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict[str, str | int]:
+        return orjson.loads(data)
+
+    def _dumps(obj: dict[str, str | int]) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = _json_loads
+    _dumps = _json_dumps
+
+
+@functools.lru_cache(maxsize=64)
+def _config_path(gnote_home: Path, branch: str | None) -> Path:
+    """Build a config file path, or the global one when branch is None."""
+    if branch is None:
+        return gnote_home / ConfigManager.GLOBAL_CONFIG_FILE
+    return gnote_home / "configs" / f"{branch}.json"
+
+
+def _write_creating_parents(path: Path, data: bytes) -> None:
+    """Write bytes to path, creating parent directories only when missing."""
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
 
 
 class ConfigManager:
@@ -14,6 +59,53 @@ class ConfigManager:
     NOTE_FILE: str = "note"
     GLOBAL_CONFIG_FILE: str = "global.config.json"
 
+    _merged_cache: dict[tuple[Path, str], dict[str, str | int]] = {}
+
+    @classmethod
+    def global_config_path(cls) -> Path:
+        """Get the path of the global config file."""
+        return _config_path(cls.GNOTE_HOME, None)
+
+    @classmethod
+    def branch_config_path(cls, branch: str) -> Path:
+        """Get the path of a branch override config file."""
+        return _config_path(cls.GNOTE_HOME, branch)
+
+    @classmethod
+    def _load_merged_data(cls, branch: str) -> dict[str, str | int]:
+        """Load raw global config data merged with branch overrides.
+
+        Results are cached per process and invalidated by the save methods.
+
+        Args:
+            branch: Branch name
+
+        Returns:
+            Merged config dictionary (a fresh copy the caller may mutate)
+        """
+        key = (cls.GNOTE_HOME, branch)
+        cached = cls._merged_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        global_path = cls.global_config_path()
+        branch_path = cls.branch_config_path(branch)
+
+        data: dict[str, str | int] = {}
+
+        try:
+            data = _loads(global_path.read_bytes())
+        except FileNotFoundError:
+            pass
+
+        try:
+            data |= _loads(branch_path.read_bytes())
+        except FileNotFoundError:
+            pass
+
+        cls._merged_cache[key] = data
+        return dict(data)
+
     @classmethod
     def load_for_branch(cls, branch: str) -> GnoteConfig:
         """Load merged config for a branch.
@@ -27,21 +119,27 @@ class ConfigManager:
         Returns:
             Merged GnoteConfig instance
         """
-        global_path = cls.GNOTE_HOME / cls.GLOBAL_CONFIG_FILE
-        branch_path = cls.GNOTE_HOME / "configs" / f"{branch}.json"
+        data = cls._load_merged_data(branch)
+        return GnoteConfig(**data) if data else GnoteConfig()
 
-        if global_path.exists():
-            with open(global_path, encoding="utf-8") as f:
-                global_data = json.load(f)
-        else:
-            global_data = {}
+    @classmethod
+    def load_for_branch_unvalidated(cls, branch: str) -> GnoteConfig:
+        """Load merged config for a branch without validation.
 
-        if branch_path.exists():
-            with open(branch_path, encoding="utf-8") as f:
-                branch_data = json.load(f)
-                global_data.update(branch_data)
+        Config files are validated when written, so read-only consumers that
+        only display the config can skip the validation pass. Only the enum
+        field is coerced so that serialization stays warning-free.
 
-        return GnoteConfig(**global_data) if global_data else GnoteConfig()
+        Args:
+            branch: Branch name
+
+        Returns:
+            Merged GnoteConfig instance built with model_construct
+        """
+        data = cls._load_merged_data(branch)
+        if "token_approach" in data:
+            data["token_approach"] = TokenApproach(data["token_approach"])
+        return GnoteConfig.model_construct(**data)
 
     @classmethod
     def save_global(cls, config: GnoteConfig) -> None:
@@ -50,11 +148,8 @@ class ConfigManager:
         Args:
             config: Config instance to save
         """
-        global_path = cls.GNOTE_HOME / cls.GLOBAL_CONFIG_FILE
-        global_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(global_path, "w", encoding="utf-8") as f:
-            json.dump(config.model_dump(), f, indent=2)
+        _write_creating_parents(cls.global_config_path(), _dumps(config.model_dump()))
+        cls._merged_cache.clear()
 
     @classmethod
     def save_branch_override(cls, branch: str, overrides: dict[str, str | int]) -> None:
@@ -64,11 +159,8 @@ class ConfigManager:
             branch: Branch name
             overrides: Dictionary of config values to override
         """
-        branch_path = cls.GNOTE_HOME / "configs" / f"{branch}.json"
-        branch_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(branch_path, "w", encoding="utf-8") as f:
-            json.dump(overrides, f, indent=2)
+        _write_creating_parents(cls.branch_config_path(branch), _dumps(overrides))
+        cls._merged_cache.pop((cls.GNOTE_HOME, branch), None)
 
     @classmethod
     def get_branch_override(cls, branch: str) -> dict[str, str | int]:
@@ -80,18 +172,15 @@ class ConfigManager:
         Returns:
             Dictionary of overrides, or empty dict if no overrides exist
         """
-        branch_path = cls.GNOTE_HOME / "configs" / f"{branch}.json"
-
-        if not branch_path.exists():
+        try:
+            return _loads(cls.branch_config_path(branch).read_bytes())
+        except FileNotFoundError:
             return {}
 
-        with open(branch_path, encoding="utf-8") as f:
-            return json.load(f)
-
     @classmethod
     def initialize_default(cls) -> None:
         """Create default global config file if it doesn't exist."""
-        global_path = cls.GNOTE_HOME / cls.GLOBAL_CONFIG_FILE
+        global_path = cls.global_config_path()
 
         if not global_path.exists():
             global_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1,17 +1,107 @@
 """Git-based context management."""
 
+import atexit
+import contextlib
+import functools
+import itertools
+import re
+import stat
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from io import BytesIO
+from pathlib import Path
 from types import TracebackType
 
-from git import Repo
+from git import Blob, Commit, Head, Repo, Tree
 from git.exc import InvalidGitRepositoryError
+from git.objects.fun import tree_entries_from_data, tree_to_stream
+from gitdb import IStream
 
 from gnote.config_manager import ConfigManager
 from gnote.logger import BranchLogger
 
+_shared_repos: dict[Path, Repo] = {}
 
-@dataclass(frozen=True)
+
+def _shared_repo(repo_path: Path) -> Repo:
+    """Open a repository once per process for branch-level lookups.
+
+    Managers keep their own ``Repo`` because MCP tools drive them from worker
+    threads concurrently, and GitPython repositories are not thread-safe.
+    Only the most recent path is kept; opening another path closes the previous
+    repository along with its persistent git processes.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        Cached repository for the path
+    """
+    repo = _shared_repos.get(repo_path)
+    if repo is None:
+        _close_shared_repos()
+        repo = _shared_repos[repo_path] = Repo(repo_path)
+    return repo
+
+
+def _put_bounded[V](cache: dict[str, V], key: str, value: V, max_size: int) -> None:
+    """Insert into a dict used as a FIFO cache, evicting the oldest entry when full."""
+    if key not in cache and len(cache) >= max_size:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+@functools.lru_cache(maxsize=64)
+def _keyword_patterns(
+    keywords: tuple[str, ...],
+) -> tuple[re.Pattern[str], re.Pattern[bytes] | None]:
+    """Compile a keyword set into case-insensitive alternations.
+
+    One alternation scans each text once for every keyword. Compiled patterns
+    are cached because agents tend to repeat the same searches.
+
+    Args:
+        keywords: Keywords to match
+
+    Returns:
+        Text pattern, and a bytes pattern when every keyword is ASCII. The
+        bytes pattern only folds ASCII case, so it agrees with the text pattern
+        on ASCII input alone.
+    """
+    pattern = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    byte_pattern = None
+    if all(keyword.isascii() for keyword in keywords):
+        byte_pattern = re.compile(
+            b"|".join(re.escape(keyword.encode()) for keyword in keywords), re.IGNORECASE
+        )
+    return pattern, byte_pattern
+
+
+def _format_timestamp(epoch_seconds: int) -> str:
+    """Format a commit time as a local ISO 8601 string.
+
+    Equivalent to ``datetime.fromtimestamp(ts).isoformat()`` for whole seconds,
+    without allocating a datetime per commit.
+
+    Args:
+        epoch_seconds: Commit time in seconds since the epoch
+
+    Returns:
+        Timestamp such as ``2025-01-31T12:00:00``
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(epoch_seconds))
+
+
+@atexit.register
+def _close_shared_repos() -> None:
+    """Close shared repositories when the process exits."""
+    for repo in _shared_repos.values():
+        repo.close()
+    _shared_repos.clear()
+
+
+@dataclass(frozen=True, slots=True)
 class CommitInfo:
     """Type for commit information."""
 
@@ -20,7 +110,7 @@ class CommitInfo:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class History:
     """Type for history."""
 
@@ -29,7 +119,7 @@ class History:
     has_more: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Snapshot:
     """Type for snapshot."""
 
@@ -38,7 +128,7 @@ class Snapshot:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Search:
     """Type for search."""
 
@@ -54,6 +144,10 @@ class GitNoteManager:
             manager.write_note("content", "message")
     """
 
+    BLOB_CACHE_SIZE: int = 256
+    _NOTE_FILE_MODE: int = 0o100644
+    COMMIT_COUNT_CACHE_SIZE: int = 64
+
     def __init__(self, branch: str) -> None:
         """Initialize Git note manager.
 
@@ -71,8 +165,13 @@ class GitNoteManager:
         self.note_file_path = self.repo_path / self.note_file
 
         self.repo = self._initialize_repo()
+        self._heads: dict[str, Head] = {head.name: head for head in self.repo.heads}
+        self._blob_cache: dict[str, str] = {}
+        self._note_blobs: dict[str, str] = {}
+        self._commit_counts: dict[str, int] = {}
+        self._pending_head: Commit | None = None
 
-        if branch not in [ref.name for ref in self.repo.heads]:
+        if branch not in self._heads:
             self._create_branch_from_main(branch)
 
         self.logger.info(f"Initialized GitNoteManager for branch: {self.branch}")
@@ -88,6 +187,7 @@ class GitNoteManager:
         exc_tb: TracebackType | None,
     ) -> None:
         """Note manager exit - cleanup resources."""
+        self._commit_counts.clear()
         self.logger.close()
 
         try:
@@ -104,6 +204,16 @@ class GitNoteManager:
         Raises:
             RuntimeError: If repository initialization fails
         """
+        # A single stat tells an existing repository apart from a fresh home,
+        # so the common open path makes no mkdir call and no failed Repo() probe.
+        if (self.repo_path / ".git" / "HEAD").is_file():
+            try:
+                repo = Repo(self.repo_path)
+                self.logger.info(f"Opened existing repository at {self.repo_path}")
+                return repo
+            except InvalidGitRepositoryError:
+                pass
+
         self.repo_path.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -142,14 +252,14 @@ class GitNoteManager:
         Args:
             branch: Name of branch to create
         """
-        if "main" in [ref.name for ref in self.repo.heads]:
-            source = self.repo.heads["main"]
+        if "main" in self._heads:
+            source = self._heads["main"]
             self.logger.info(f"Creating branch '{branch}' from 'main'")
         else:
             source = self.repo.active_branch
             self.logger.info(f"Creating branch '{branch}' from '{source.name}'")
 
-        self.repo.create_head(branch, source)
+        self._heads[branch] = self.repo.create_head(branch, source)
         self.logger.info(f"Branch '{branch}' created")
 
     @staticmethod
@@ -162,9 +272,8 @@ class GitNoteManager:
         Raises:
             RuntimeError: If repository doesn't exist or can't be accessed
         """
-        repo_path = ConfigManager.REPO_PATH
         try:
-            repo = Repo(repo_path)
+            repo = _shared_repo(ConfigManager.REPO_PATH)
             branch_name = repo.active_branch.name
             return branch_name
         except (InvalidGitRepositoryError, Exception) as e:
@@ -179,6 +288,31 @@ class GitNoteManager:
         """
         return self.branch
 
+    def switch_branch(self, branch: str) -> None:
+        """Point this manager at another branch, reusing the open repository.
+
+        The branch is created from main (or the active branch) when missing,
+        as in `__init__`.
+
+        Args:
+            branch: Branch to operate on
+
+        Raises:
+            RuntimeError: If called inside a `bulk` block
+        """
+        if self._pending_head is not None:
+            raise RuntimeError("Cannot switch branches inside bulk()")
+        if branch == self.branch:
+            return
+
+        if branch not in self._heads:
+            self._create_branch_from_main(branch)
+
+        self.logger.close()
+        self.branch = branch
+        self.logger = BranchLogger(branch)
+        self.logger.info(f"Switched GitNoteManager to branch: {branch}")
+
     def read_note(self) -> str:
         """Read current note content from branch HEAD.
 
@@ -190,15 +324,43 @@ class GitNoteManager:
         """
         try:
             self.logger.info(f"Reading note from branch '{self.branch}'")
-            commit = self.repo.heads[self.branch].commit
-            blob = commit.tree / self.note_file
-            content = blob.data_stream.read().decode("utf-8")
+            commit = self._tip()
+            content = self._note_text(commit)
             self.logger.info(f"Read {len(content)} characters from note")
             return content
         except Exception as e:
             self.logger.error(f"Failed to read note: {e}")
             raise RuntimeError(f"Failed to read note from branch '{self.branch}': {e}") from e
 
+    def _tip(self) -> Commit:
+        """Get the branch tip, including commits deferred by `bulk`."""
+        if self._pending_head is not None:
+            return self._pending_head
+        return self._heads[self.branch].commit
+
+    @contextlib.contextmanager
+    def bulk(self) -> Iterator[None]:
+        """Defer the branch ref update across several writes.
+
+        Writes inside the block chain their commits in memory and the branch
+        is moved once, to the last commit, when the block exits:
+            with manager.bulk():
+                for content, message in notes:
+                    manager.write_note(content, message)
+        """
+        if self._pending_head is not None:
+            yield
+            return
+
+        self._pending_head = self._heads[self.branch].commit
+        try:
+            yield
+        finally:
+            tip, self._pending_head = self._pending_head, None
+            if tip != self._heads[self.branch].commit:
+                self._move_branch(tip)
+                self.logger.info(f"Moved '{self.branch}' to {tip.hexsha[:8]}")
+
     def write_note(self, content: str, message: str) -> str:
         """Write new content to note file and commit.
 
@@ -214,21 +376,110 @@ class GitNoteManager:
         """
         try:
             self.logger.info(f"Writing note: {message}")
-            parent = self.repo.heads[self.branch].commit
+            commit_sha, blob_sha = self._commit_note(content.encode("utf-8"), message)
+            self._cache_blob_text(blob_sha, content)
+            return commit_sha
+        except Exception as e:
+            self.logger.error(f"Failed to write note: {e}")
+            raise RuntimeError(f"Failed to write note: {e}") from e
 
-            self.note_file_path.write_text(content, encoding="utf-8")
+    def write_notes(self, notes: list[tuple[str, str]]) -> list[str]:
+        """Write several note versions as a chain of commits.
 
-            self.repo.index.reset(commit=parent)
-            self.repo.index.add([self.note_file])
-            new_commit = self.repo.index.commit(message, parent_commits=[parent], head=False)
+        The branch is moved once, to the last commit (see `bulk`).
 
-            self.repo.heads[self.branch].commit = new_commit
+        Args:
+            notes: (content, message) pairs, oldest first
 
-            self.logger.info(f"Committed: {new_commit.hexsha[:8]}")
-            return new_commit.hexsha
-        except Exception as e:
-            self.logger.error(f"Failed to write note: {e}")
-            raise RuntimeError(f"Failed to write note: {e}") from e
+        Returns:
+            Git commit SHA hashes, in the same order
+
+        Raises:
+            RuntimeError: If a Git commit fails
+        """
+        with self.bulk():
+            return [self.write_note(content, message) for content, message in notes]
+
+    def _commit_note(self, data: bytes, message: str) -> tuple[str, str]:
+        """Commit raw note content on top of the branch head.
+
+        Args:
+            data: Encoded note content
+            message: Commit message
+
+        Returns:
+            Tuple of the new commit SHA and the note blob SHA
+        """
+        parent = self._tip()
+
+        blob_sha = self.repo.odb.store(IStream(Blob.type, len(data), BytesIO(data))).binsha
+        tree = self._tree_with_note(parent.tree, blob_sha)
+        new_commit = Commit.create_from_tree(
+            self.repo, tree, message, parent_commits=[parent], head=False
+        )
+
+        if self._pending_head is not None:
+            self._pending_head = new_commit
+        else:
+            self._move_branch(new_commit)
+
+        # A known count for the parent carries over to the new head.
+        parent_total = self._commit_counts.pop(parent.hexsha, None)
+        if parent_total is not None:
+            _put_bounded(
+                self._commit_counts,
+                new_commit.hexsha,
+                parent_total + 1,
+                self.COMMIT_COUNT_CACHE_SIZE,
+            )
+
+        _put_bounded(self._note_blobs, new_commit.hexsha, blob_sha.hex(), self.BLOB_CACHE_SIZE)
+
+        self.logger.info(f"Committed: {new_commit.hexsha[:8]}")
+        return new_commit.hexsha, blob_sha.hex()
+
+    def _move_branch(self, commit: Commit) -> None:
+        """Point the branch at commit, keeping a checkout of it in sync.
+
+        Commits are built in the object database, so when the branch is the
+        checked-out one its index and working tree are reset to match;
+        otherwise the stale note would block the next checkout.
+
+        Args:
+            commit: New branch tip
+        """
+        head = self._heads[self.branch]
+        head.commit = commit
+        if not self.repo.head.is_detached and self.repo.head.ref == head:
+            self.repo.head.reset(commit, index=True, working_tree=True)
+
+    def _tree_with_note(self, parent_tree: Tree, blob_sha: bytes) -> Tree:
+        """Store a copy of a tree with the note entry pointing at a new blob.
+
+        Building the tree directly in the object database avoids staging the
+        note through the index; `_move_branch` syncs a checkout afterwards.
+
+        Args:
+            parent_tree: Tree of the parent commit
+            blob_sha: Binary SHA of the new note blob
+
+        Returns:
+            The stored tree
+        """
+        entries = [
+            entry
+            for entry in tree_entries_from_data(parent_tree.data_stream.read())
+            if entry[2] != self.note_file
+        ]
+        entries.append((blob_sha, self._NOTE_FILE_MODE, self.note_file))
+        # Git orders tree entries by name, with directories compared as "name/".
+        entries.sort(key=lambda entry: entry[2] + "/" if stat.S_ISDIR(entry[1]) else entry[2])
+
+        stream = BytesIO()
+        tree_to_stream(entries, stream.write)
+        data = stream.getvalue()
+        tree_sha = self.repo.odb.store(IStream(Tree.type, len(data), BytesIO(data))).binsha
+        return Tree(self.repo, tree_sha)
 
     def append_note(self, text: str, message: str) -> str:
         """Append text to note file and commit.
@@ -239,14 +490,29 @@ class GitNoteManager:
 
         Returns:
             Git commit SHA hash
-        """
-        self.logger.info(f"Appending to note: {message}")
-        current = self.read_note()
 
-        separator = "\n" if current and not current.endswith("\n") else ""
-        new_content = current + separator + text
+        Raises:
+            RuntimeError: If Git commit fails
+        """
+        try:
+            self.logger.info(f"Appending to note: {message}")
+            current_sha = self._note_blob_sha(self._tip())
+
+            # The text is appended to the stored bytes, so the current note is
+            # never decoded or re-encoded as a whole.
+            current = self.repo.odb.stream(bytes.fromhex(current_sha)).read()
+            separator = "\n" if current and not current.endswith(b"\n") else ""
+            commit_sha, blob_sha = self._commit_note(
+                current + (separator + text).encode("utf-8"), message
+            )
 
-        return self.write_note(new_content, message)
+            cached = self._blob_cache.get(current_sha)
+            if cached is not None:
+                self._cache_blob_text(blob_sha, cached + separator + text)
+            return commit_sha
+        except Exception as e:
+            self.logger.error(f"Failed to append note: {e}")
+            raise RuntimeError(f"Failed to append note: {e}") from e
 
     def get_history(self, limit: int = 10, starting_after: str | None = None) -> History:
         """Get commit history for branch.
@@ -265,37 +531,45 @@ class GitNoteManager:
             f"Getting history for branch '{self.branch}' "
             f"(limit={limit}, starting_after={starting_after})"
         )
-        total = sum(1 for _ in self.repo.iter_commits(self.branch))
+        head = self._tip()
+        total = self._count_commits(head)
 
+        # One extra commit is fetched to tell whether another page exists.
+        # Starting after a commit walks its ancestry minus the commit itself.
         if starting_after:
-            start = self.repo.commit(starting_after)
-            if start.parents:
-                commits_iter = self.repo.iter_commits(start.parents[0], max_count=limit)
-            else:
-                return History(commits=[], total_commits=total, has_more=False)
+            commits_iter = self.repo.iter_commits(starting_after, max_count=limit + 1, skip=1)
         else:
-            commits_iter = self.repo.iter_commits(self.branch, max_count=limit)
+            commits_iter = self.repo.iter_commits(head, max_count=limit + 1)
 
-        commits: list[CommitInfo] = []
-        for c in commits_iter:
-            msg = c.message
-            commit_message = str(msg).strip()
-            commits.append(
-                CommitInfo(
-                    sha=c.hexsha,
-                    message=commit_message,
-                    timestamp=datetime.fromtimestamp(c.committed_date).isoformat(),
-                )
+        commits = [
+            CommitInfo(
+                sha=c.hexsha,
+                message=str(c.message).strip(),
+                timestamp=_format_timestamp(c.committed_date),
             )
-
-        has_more = False
-        if commits:
-            last = self.repo.commit(commits[-1].sha)
-            has_more = len(last.parents) > 0
+            for c in commits_iter
+        ]
+        has_more = len(commits) > limit
+        del commits[limit:]
 
         self.logger.info(f"Retrieved {len(commits)} commits (total={total}, has_more={has_more})")
         return History(commits=commits, total_commits=total, has_more=has_more)
 
+    def _count_commits(self, head: Commit) -> int:
+        """Count the commits reachable from a head, reusing earlier counts.
+
+        Args:
+            head: Branch head commit
+
+        Returns:
+            Number of commits in the head's history
+        """
+        total = self._commit_counts.get(head.hexsha)
+        if total is None:
+            total = int(self.repo.git.rev_list("--count", head.hexsha))
+            _put_bounded(self._commit_counts, head.hexsha, total, self.COMMIT_COUNT_CACHE_SIZE)
+        return total
+
     def get_snapshot(self, commit_sha: str) -> Snapshot:
         """Get note content from specific commit.
 
@@ -311,10 +585,9 @@ class GitNoteManager:
         try:
             self.logger.info(f"Getting snapshot for commit {commit_sha[:8]}")
             commit = self.repo.commit(commit_sha)
-            blob = commit.tree / self.note_file
-            content: str = blob.data_stream.read().decode("utf-8")
+            content = self._note_text(commit)
             commit_message: str = str(commit.message).strip()
-            timestamp: str = datetime.fromtimestamp(commit.committed_date).isoformat()
+            timestamp: str = _format_timestamp(commit.committed_date)
 
             self.logger.info(f"Retrieved snapshot: {len(content)} characters")
             return Snapshot(
@@ -326,6 +599,86 @@ class GitNoteManager:
             self.logger.error(f"Failed to get snapshot: {e}")
             raise RuntimeError(f"Failed to get snapshot for commit {commit_sha}: {e}") from e
 
+    def _cache_blob_text(self, blob_sha: str, content: str) -> None:
+        """Store decoded blob content, evicting the oldest entry when full."""
+        _put_bounded(self._blob_cache, blob_sha, content, self.BLOB_CACHE_SIZE)
+
+    def _note_blob_sha(self, commit: Commit) -> str:
+        """Get the SHA of a commit's note blob, remembering it per commit.
+
+        Commits are immutable, so the tree lookup is done at most once per
+        commit; commits written by this manager are recorded as they are made.
+        """
+        blob_sha = self._note_blobs.get(commit.hexsha)
+        if blob_sha is None:
+            blob_sha = (commit.tree / self.note_file).hexsha
+            _put_bounded(self._note_blobs, commit.hexsha, blob_sha, self.BLOB_CACHE_SIZE)
+        return blob_sha
+
+    def _note_text(self, commit: Commit) -> str:
+        """Get a commit's decoded note, reusing cached text for known blob SHAs.
+
+        Commits that do not touch the note file share its blob, so snapshots
+        and searches across history often see the same SHA repeatedly.
+        """
+        blob_sha = self._note_blob_sha(commit)
+        content = self._blob_cache.get(blob_sha)
+        if content is None:
+            content = self.repo.odb.stream(bytes.fromhex(blob_sha)).read().decode("utf-8")
+            self._cache_blob_text(blob_sha, content)
+        return content
+
+    def _read_blobs(self, blob_shas: list[str]) -> dict[str, bytes]:
+        """Read several blobs through the repository's persistent `git cat-file`.
+
+        The `--batch` process is shared across reads, so a session pays for
+        process startup and pack index loading once rather than on every read.
+
+        Args:
+            blob_shas: Hex SHAs of blobs to read
+
+        Returns:
+            Mapping of blob SHA to raw content; missing objects are omitted
+        """
+        if not blob_shas:
+            return {}
+
+        blobs: dict[str, bytes] = {}
+        for sha in blob_shas:
+            try:
+                _, _, _, data = self.repo.git.get_object_data(sha)
+            except ValueError:
+                continue
+            blobs[sha] = data
+        return blobs
+
+    def _note_blob_shas(self, commit_shas: list[str]) -> dict[str, str]:
+        """Resolve the note blob of several commits through git's cat-file.
+
+        Lookups go through the repository's persistent `git cat-file
+        --batch-check` process and are remembered per commit.
+
+        Args:
+            commit_shas: Hex SHAs of commits
+
+        Returns:
+            Mapping of commit SHA to note blob SHA; commits without a note are omitted
+        """
+        blob_shas: dict[str, str] = {}
+        for commit_sha in commit_shas:
+            blob_sha = self._note_blobs.get(commit_sha)
+            if blob_sha is None:
+                try:
+                    blob_sha, _, _ = self.repo.git.get_object_header(
+                        f"{commit_sha}:{self.note_file}"
+                    )
+                except ValueError:
+                    continue
+                blob_sha = blob_sha.decode()
+                _put_bounded(self._note_blobs, commit_sha, blob_sha, self.BLOB_CACHE_SIZE)
+            blob_shas[commit_sha] = blob_sha
+        return blob_shas
+
     def search_history(self, keywords: list[str], limit: int = 100) -> Search:
         """Search commit history for keywords in messages or content.
 
@@ -348,37 +701,58 @@ class GitNoteManager:
             if not keywords:
                 return Search(commits=[], total_matches=0)
 
-            normalized_keywords = [kw.lower() for kw in keywords]
-
-            matching_commits: list[CommitInfo] = []
-            searched_count = 0
+            pattern, byte_pattern = _keyword_patterns(tuple(keywords))
 
-            for commit in self.repo.iter_commits(self.branch):
-                if searched_count >= limit:
-                    break
-                searched_count += 1
+            # One `git log` call yields the SHA, commit time and message of every
+            # commit in the window without building GitPython Commit objects.
+            # Note contents are only needed for commits whose message did not
+            # match, and are resolved and fetched in bulk.
+            log = self.repo.git.log(
+                "-z", f"--max-count={limit}", "--format=%H%x00%ct%x00%B", self._tip().hexsha
+            )
+            window = [
+                (sha, int(committed_date), message.strip())
+                for sha, committed_date, message in itertools.batched(
+                    log.split("\0")[:-1], 3, strict=True
+                )
+            ]
 
-                commit_message = str(commit.message).strip()
+            message_matches = {sha for sha, _, message in window if pattern.search(message)}
+            note_blobs = self._note_blob_shas(
+                [sha for sha, _, _ in window if sha not in message_matches]
+            )
 
-                try:
-                    blob = commit.tree / self.note_file
-                    content = blob.data_stream.read().decode("utf-8")
-                except Exception:
+            # Blobs already decoded are scanned as text. The rest are scanned as
+            # raw bytes, skipping the decode, when both the keywords and the blob
+            # are ASCII: only then does ASCII case folding agree with the text
+            # pattern's Unicode folding (e.g. "k" also matches KELVIN SIGN).
+            blob_matches: dict[str, bool] = {}
+            uncached: list[str] = []
+            for sha in dict.fromkeys(note_blobs.values()):
+                text = self._blob_cache.get(sha)
+                if text is None:
+                    uncached.append(sha)
+                else:
+                    blob_matches[sha] = bool(pattern.search(text))
+            for sha, data in self._read_blobs(uncached).items():
+                if byte_pattern is not None and data.isascii():
+                    blob_matches[sha] = bool(byte_pattern.search(data))
                     continue
+                text = data.decode("utf-8")
+                self._cache_blob_text(sha, text)
+                blob_matches[sha] = bool(pattern.search(text))
 
-                search_text = (commit_message + "\n" + content).lower()
-                if any(keyword in search_text for keyword in normalized_keywords):
-                    matching_commits.append(
-                        CommitInfo(
-                            sha=commit.hexsha,
-                            message=commit_message,
-                            timestamp=datetime.fromtimestamp(commit.committed_date).isoformat(),
-                        )
-                    )
+            matching_commits = [
+                CommitInfo(
+                    sha=sha,
+                    message=message,
+                    timestamp=_format_timestamp(committed_date),
+                )
+                for sha, committed_date, message in window
+                if sha in message_matches or (sha in note_blobs and blob_matches[note_blobs[sha]])
+            ]
 
-            self.logger.info(
-                f"Found {len(matching_commits)} matches out of {searched_count} commits searched"
-            )
+            self.logger.info(f"Found {len(matching_commits)} matches out of {len(window)} commits")
             return Search(
                 commits=matching_commits,
                 total_matches=len(matching_commits),
@@ -397,11 +771,11 @@ class GitNoteManager:
         Raises:
             RuntimeError: If repository doesn't exist
         """
-        repo_path = ConfigManager.REPO_PATH
         try:
-            repo = Repo(repo_path)
-            branches = [ref.name for ref in repo.heads]
-            return branches
+            repo = _shared_repo(ConfigManager.REPO_PATH)
+            # for-each-ref reads packed and loose refs in git itself, without
+            # building a Head object per branch.
+            return repo.git.for_each_ref("--format=%(refname:lstrip=2)", "refs/heads/").splitlines()
         except (InvalidGitRepositoryError, Exception) as e:
             raise RuntimeError(f"Failed to list branches: {e}") from e
 
@@ -418,17 +792,17 @@ class GitNoteManager:
         Raises:
             ValueError: If branch already exists
         """
-        if name in GitNoteManager.list_branches():
+        if name in self._heads:
             raise ValueError(f"Branch '{name}' already exists")
 
         if from_branch:
-            if from_branch not in GitNoteManager.list_branches():
+            if from_branch not in self._heads:
                 raise ValueError(f"Source branch '{from_branch}' does not exist")
-            source = self.repo.heads[from_branch]
+            source = self._heads[from_branch]
         else:
-            source = self.repo.heads[self.branch]
+            source = self._tip()
 
-        self.repo.create_head(name, source)
+        self._heads[name] = self.repo.create_head(name, source)
         self.logger.info(f"Created branch: {name}")
         return name
 
@@ -446,11 +820,11 @@ class GitNoteManager:
             ValueError: If branch doesn't exist
             RuntimeError: If repository doesn't exist or checkout fails
         """
-        repo_path = ConfigManager.REPO_PATH
         try:
-            repo = Repo(repo_path)
-            if name not in [ref.name for ref in repo.heads]:
+            repo = _shared_repo(ConfigManager.REPO_PATH)
+            heads = {head.name: head for head in repo.heads}
+            if name not in heads:
                 raise ValueError(f"Branch '{name}' does not exist")
-            repo.heads[name].checkout()
+            heads[name].checkout()
         except (InvalidGitRepositoryError, Exception) as e:
             raise RuntimeError(f"Failed to checkout branch: {e}") from e
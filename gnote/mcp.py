@@ -1,16 +1,38 @@
 """MCP tools for Git-based context and memory management."""
 
 import asyncio
+import atexit
+import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from typing import Concatenate
 
 from mcp.server.fastmcp import FastMCP
 
 from gnote.config import GnoteConfig
 from gnote.config_manager import ConfigManager
-from gnote.git_manager import CommitInfo, GitNoteManager
+from gnote.git_manager import CommitInfo, GitNoteManager, History
 from gnote.logger import BranchLogger
 from gnote.token_counter import TokenCounter
 
+_HEX_RE = re.compile(r"[0-9a-fA-F]+")
+
+
+def _commit_sha_error(commit_sha: str) -> str:
+    """Check a user-supplied commit SHA.
+
+    Args:
+        commit_sha: SHA passed to a tool
+
+    Returns:
+        Error message, or an empty string if the SHA is acceptable
+    """
+    if not commit_sha or len(commit_sha) < 7:
+        return "commit_sha must be at least 7 characters"
+    if not _HEX_RE.fullmatch(commit_sha):
+        return "commit_sha must be a valid hexadecimal hash"
+    return ""
+
 
 @dataclass(frozen=True)
 class ReadNoteResult:
@@ -49,24 +71,25 @@ class AppendNoteResult:
 
 
 @dataclass(frozen=True)
-class HistoryResult:
-    """Result from getting history with error handling."""
+class SnapshotResult:
+    """Result from getting snapshot with error handling."""
 
     success: bool
-    commits: list[CommitInfo] = field(default_factory=list)
-    total_commits: int = 0
-    has_more: bool = False
+    content: str = ""
+    commit_message: str = ""
+    timestamp: str = ""
     error: str = ""
 
 
 @dataclass(frozen=True)
-class SnapshotResult:
-    """Result from getting snapshot with error handling."""
+class HistoryResult:
+    """Result from getting history with error handling."""
 
     success: bool
-    content: str = ""
-    commit_message: str = ""
-    timestamp: str = ""
+    commits: list[CommitInfo] = field(default_factory=list)
+    total_commits: int = 0
+    has_more: bool = False
+    snapshots: dict[str, SnapshotResult] = field(default_factory=dict)
     error: str = ""
 
 
@@ -95,19 +118,42 @@ def setup_mcp(
     Returns:
         Configured FastMCP server instance
     """
-    with BranchLogger(branch) as logger:
-        logger.info(f"Setting up MCP tools for branch: {branch}")
+    # One logger serves setup and every tool call; opening a BranchLogger per
+    # call would also tear down the shared handler each time it closed.
+    logger = BranchLogger(branch)
+    atexit.register(logger.close)
 
-        if config_override:
-            config = config_override
-            logger.info(f"Using config override: {config.model_dump_json()}")
-        else:
-            config = ConfigManager.load_for_branch(branch)
-            logger.info(f"Config loaded: {config.model_dump_json()}")
+    logger.info(f"Setting up MCP tools for branch: {branch}")
 
-        logger.info("MCP tools setup complete")
+    if config_override:
+        config = config_override
+        logger.info(f"Using config override: {config.model_dump_json()}")
+    else:
+        config = ConfigManager.load_for_branch(branch)
+        logger.info(f"Config loaded: {config.model_dump_json()}")
+
+    logger.info("MCP tools setup complete")
 
     counter = TokenCounter(config.token_approach)
+    count_tokens = counter.get_count_fn()
+    pressure_of = counter.get_pressure_fn(config.token_limit)
+
+    # One manager serves every tool call for the server's lifetime, so the
+    # repository and branch heads are opened once. GitPython repositories are
+    # not thread-safe, so calls into the manager run one at a time.
+    manager_lock = asyncio.Lock()
+    shared_manager: GitNoteManager | None = None
+
+    async def run_with_manager[**P, T](
+        fn: Callable[Concatenate[GitNoteManager, P], T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run fn with the shared manager on a worker thread."""
+        nonlocal shared_manager
+        async with manager_lock:
+            if shared_manager is None:
+                shared_manager = await asyncio.to_thread(GitNoteManager, branch)
+                atexit.register(shared_manager.__exit__, None, None, None)
+            return await asyncio.to_thread(fn, shared_manager, *args, **kwargs)
 
     mcp = FastMCP("gnote")
 
@@ -132,11 +178,12 @@ organization and compression when token limits are approached.
 - Consider compression when `token_pressure_percentage` > 0.8
 - Review history before compression to avoid losing important information
 """
+    USAGE_GUIDE_RESOURCE = f"# Context Management with gnote\n\n{USAGE_GUIDE}"
 
     @mcp.resource("gnote://usage-guide")
     async def get_usage_guide() -> str:
         """Usage guide for gnote note management tools."""
-        return f"# Context Management with gnote\n\n{USAGE_GUIDE}"
+        return USAGE_GUIDE_RESOURCE
 
     if enable_guidance_tool:
 
@@ -161,30 +208,31 @@ organization and compression when token limits are approached.
             - token_pressure_percentage (float): Percentage of limit used (0.0-1.0)
             - error (str): Error message if failed
         """
-        with BranchLogger(branch) as logger:
-            logger.info("Tool called: read_note")
-
-            try:
-                with GitNoteManager(branch) as manager:
-                    content = await asyncio.to_thread(manager.read_note)
-                    token_count = counter.count(content)
-                    pressure = counter.calculate_pressure(token_count, config.token_limit)
-
-                    logger.info(f"Read note: {token_count} tokens")
-
-                    return ReadNoteResult(
-                        success=True,
-                        content=content,
-                        token_count=token_count,
-                        token_limit=config.token_limit,
-                        token_pressure_percentage=pressure["token_pressure_percentage"],
-                    )
-            except Exception as e:
-                logger.error(f"Failed to read note: {e}")
-                return ReadNoteResult(
-                    success=False,
-                    error=str(e),
-                )
+        logger.info("Tool called: read_note")
+
+        def _read_and_count(manager: GitNoteManager) -> tuple[str, int]:
+            content = manager.read_note()
+            return content, count_tokens(content)
+
+        try:
+            content, token_count = await run_with_manager(_read_and_count)
+            pressure = pressure_of(token_count)
+
+            logger.info(f"Read note: {token_count} tokens")
+
+            return ReadNoteResult(
+                success=True,
+                content=content,
+                token_count=token_count,
+                token_limit=config.token_limit,
+                token_pressure_percentage=pressure,
+            )
+        except Exception as e:
+            logger.error(f"Failed to read note: {e}")
+            return ReadNoteResult(
+                success=False,
+                error=str(e),
+            )
 
     @mcp.tool()
     async def update_note(new_note: str, commit_message: str) -> UpdateNoteResult:
@@ -212,38 +260,34 @@ organization and compression when token limits are approached.
             - token_pressure_percentage (float): New pressure percentage
             - error (str): Error message if failed
         """
-        with BranchLogger(branch) as logger:
-            logger.info(f"Tool called: update_note - {commit_message}")
-
-            try:
-                with GitNoteManager(branch) as manager:
-                    old_content = await asyncio.to_thread(manager.read_note)
-                    old_token_count = counter.count(old_content)
-
-                    commit_sha = await asyncio.to_thread(
-                        manager.write_note, new_note, commit_message
-                    )
-
-                    new_token_count = counter.count(new_note)
-                    token_delta = new_token_count - old_token_count
-
-                    pressure = counter.calculate_pressure(new_token_count, config.token_limit)
-
-                    logger.info(f"Updated note: {new_token_count} tokens (delta: {token_delta})")
-
-                    return UpdateNoteResult(
-                        success=True,
-                        commit_sha=commit_sha,
-                        new_token_count=new_token_count,
-                        token_delta=token_delta,
-                        token_pressure_percentage=pressure["token_pressure_percentage"],
-                    )
-            except Exception as e:
-                logger.error(f"Failed to update note: {e}")
-                return UpdateNoteResult(
-                    success=False,
-                    error=str(e),
-                )
+        logger.info(f"Tool called: update_note - {commit_message}")
+
+        def _write_and_count(manager: GitNoteManager) -> tuple[str, int, int]:
+            old_token_count = count_tokens(manager.read_note())
+            commit_sha = manager.write_note(new_note, commit_message)
+            return commit_sha, old_token_count, count_tokens(new_note)
+
+        try:
+            commit_sha, old_token_count, new_token_count = await run_with_manager(_write_and_count)
+            token_delta = new_token_count - old_token_count
+
+            pressure = pressure_of(new_token_count)
+
+            logger.info(f"Updated note: {new_token_count} tokens (delta: {token_delta})")
+
+            return UpdateNoteResult(
+                success=True,
+                commit_sha=commit_sha,
+                new_token_count=new_token_count,
+                token_delta=token_delta,
+                token_pressure_percentage=pressure,
+            )
+        except Exception as e:
+            logger.error(f"Failed to update note: {e}")
+            return UpdateNoteResult(
+                success=False,
+                error=str(e),
+            )
 
     @mcp.tool()
     async def append_to_note(text: str, commit_message: str) -> AppendNoteResult:
@@ -271,41 +315,43 @@ organization and compression when token limits are approached.
             - token_pressure_percentage (float): New pressure percentage
             - error (str): Error message if failed
         """
-        with BranchLogger(branch) as logger:
-            logger.info(f"Tool called: append_to_note - {commit_message}")
-
-            try:
-                with GitNoteManager(branch) as manager:
-                    old_content = await asyncio.to_thread(manager.read_note)
-                    old_token_count = counter.count(old_content)
-
-                    commit_sha = await asyncio.to_thread(manager.append_note, text, commit_message)
-
-                    new_content = await asyncio.to_thread(manager.read_note)
-                    new_token_count = counter.count(new_content)
-                    token_delta = new_token_count - old_token_count
-
-                    pressure = counter.calculate_pressure(new_token_count, config.token_limit)
-
-                    log_msg = f"Appended to note: {new_token_count} tokens (delta: +{token_delta})"
-                    logger.info(log_msg)
-
-                    return AppendNoteResult(
-                        success=True,
-                        commit_sha=commit_sha,
-                        new_token_count=new_token_count,
-                        token_delta=token_delta,
-                        token_pressure_percentage=pressure["token_pressure_percentage"],
-                    )
-            except Exception as e:
-                logger.error(f"Failed to append to note: {e}")
-                return AppendNoteResult(
-                    success=False,
-                    error=str(e),
-                )
+        logger.info(f"Tool called: append_to_note - {commit_message}")
+
+        def _append_and_count(manager: GitNoteManager) -> tuple[str, int, int]:
+            old_token_count = count_tokens(manager.read_note())
+            commit_sha = manager.append_note(text, commit_message)
+            new_token_count = count_tokens(manager.read_note())
+            return commit_sha, old_token_count, new_token_count
+
+        try:
+            commit_sha, old_token_count, new_token_count = await run_with_manager(_append_and_count)
+            token_delta = new_token_count - old_token_count
+
+            pressure = pressure_of(new_token_count)
+
+            log_msg = f"Appended to note: {new_token_count} tokens (delta: +{token_delta})"
+            logger.info(log_msg)
+
+            return AppendNoteResult(
+                success=True,
+                commit_sha=commit_sha,
+                new_token_count=new_token_count,
+                token_delta=token_delta,
+                token_pressure_percentage=pressure,
+            )
+        except Exception as e:
+            logger.error(f"Failed to append to note: {e}")
+            return AppendNoteResult(
+                success=False,
+                error=str(e),
+            )
 
     @mcp.tool()
-    async def get_note_history(limit: int = 10, starting_after: str | None = None) -> HistoryResult:
+    async def get_note_history(
+        limit: int = 10,
+        starting_after: str | None = None,
+        include_content_for: list[str] | None = None,
+    ) -> HistoryResult:
         """Retrieve paginated commit history of note changes.
 
         Use this tool to explore past note states and find relevant historical
@@ -318,12 +364,16 @@ organization and compression when token limits are approached.
         - Chain calls using the last SHA from previous results to paginate
 
         After finding a relevant commit in the history, use get_snapshot() with the
-        commit SHA to retrieve the actual note content from that point in time.
+        commit SHA to retrieve the actual note content from that point in time. When
+        you already know which commits you want, pass their SHAs in
+        include_content_for to get their content in the same call.
 
         Args:
             limit: Number of commits to retrieve (default: 10)
             starting_after: SHA of commit to start after (get older commits), or None
                 for most recent
+            include_content_for: SHAs of commits whose note content to include (at most
+                limit entries)
 
         Returns:
             HistoryResult containing:
@@ -331,31 +381,61 @@ organization and compression when token limits are approached.
             - commits (list[CommitInfo]): Array of CommitInfo objects with sha, message, timestamp
             - total_commits (int): Total number of commits in history
             - has_more (bool): True if more commits exist beyond this page
+            - snapshots (dict[str, SnapshotResult]): Content for each SHA in
+              include_content_for, keyed by the requested SHA
             - error (str): Error message if failed
         """
-        with BranchLogger(branch) as logger:
-            logger.info(f"Tool called: get_note_history (limit={limit})")
-
-            try:
-                if limit <= 0:
-                    raise ValueError("limit must be positive")
-
-                with GitNoteManager(branch) as manager:
-                    result = await asyncio.to_thread(manager.get_history, limit, starting_after)
-                    logger.info(f"Retrieved {len(result.commits)} commits")
-
-                    return HistoryResult(
-                        success=True,
-                        commits=result.commits,
-                        total_commits=result.total_commits,
-                        has_more=result.has_more,
-                    )
-            except Exception as e:
-                logger.error(f"Failed to get history: {e}")
-                return HistoryResult(
-                    success=False,
-                    error=str(e),
+        logger.info(f"Tool called: get_note_history (limit={limit})")
+
+        def _history_and_snapshots(
+            manager: GitNoteManager,
+        ) -> tuple[History, dict[str, SnapshotResult]]:
+            history = manager.get_history(limit, starting_after)
+            snapshots: dict[str, SnapshotResult] = {}
+            for sha in include_content_for or ():
+                error = _commit_sha_error(sha)
+                if error:
+                    snapshots[sha] = SnapshotResult(success=False, error=error)
+                    continue
+                try:
+                    snapshot = manager.get_snapshot(sha)
+                except RuntimeError as e:
+                    snapshots[sha] = SnapshotResult(success=False, error=str(e))
+                    continue
+                snapshots[sha] = SnapshotResult(
+                    success=True,
+                    content=snapshot.content,
+                    commit_message=snapshot.commit_message,
+                    timestamp=snapshot.timestamp,
                 )
+            return history, snapshots
+
+        if limit <= 0:
+            logger.error("Failed to get history: limit must be positive")
+            return HistoryResult(success=False, error="limit must be positive")
+        if include_content_for and len(include_content_for) > limit:
+            logger.error("Failed to get history: too many SHAs in include_content_for")
+            return HistoryResult(
+                success=False, error="include_content_for must not have more entries than limit"
+            )
+
+        try:
+            result, snapshots = await run_with_manager(_history_and_snapshots)
+            logger.info(f"Retrieved {len(result.commits)} commits, {len(snapshots)} snapshots")
+
+            return HistoryResult(
+                success=True,
+                commits=result.commits,
+                total_commits=result.total_commits,
+                has_more=result.has_more,
+                snapshots=snapshots,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get history: {e}")
+            return HistoryResult(
+                success=False,
+                error=str(e),
+            )
 
     @mcp.tool()
     async def get_snapshot(commit_sha: str) -> SnapshotResult:
@@ -383,30 +463,28 @@ organization and compression when token limits are approached.
             - timestamp (str): ISO format timestamp when commit was made
             - error (str): Error message if success is False
         """
-        with BranchLogger(branch) as logger:
-            logger.info(f"Tool called: get_snapshot (sha={commit_sha[:8]})")
-            try:
-                if not commit_sha or len(commit_sha) < 7:
-                    raise ValueError("commit_sha must be at least 7 characters")
-                if not all(c in "0123456789abcdefABCDEF" for c in commit_sha):
-                    raise ValueError("commit_sha must be a valid hexadecimal hash")
-
-                with GitNoteManager(branch) as manager:
-                    result = await asyncio.to_thread(manager.get_snapshot, commit_sha)
-                    logger.info(f"Retrieved snapshot from {commit_sha[:8]}")
-
-                    return SnapshotResult(
-                        success=True,
-                        content=result.content,
-                        commit_message=result.commit_message,
-                        timestamp=result.timestamp,
-                    )
-            except Exception as e:
-                logger.error(f"Failed to get snapshot: {e}")
-                return SnapshotResult(
-                    success=False,
-                    error=str(e),
-                )
+        logger.info(f"Tool called: get_snapshot (sha={commit_sha[:8]})")
+        error = _commit_sha_error(commit_sha)
+        if error:
+            logger.error(f"Failed to get snapshot: {error}")
+            return SnapshotResult(success=False, error=error)
+
+        try:
+            result = await run_with_manager(GitNoteManager.get_snapshot, commit_sha)
+            logger.info(f"Retrieved snapshot from {commit_sha[:8]}")
+
+            return SnapshotResult(
+                success=True,
+                content=result.content,
+                commit_message=result.commit_message,
+                timestamp=result.timestamp,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get snapshot: {e}")
+            return SnapshotResult(
+                success=False,
+                error=str(e),
+            )
 
     @mcp.tool()
     async def search_note_history(keywords: list[str], limit: int = 100) -> SearchResult:
@@ -426,23 +504,21 @@ organization and compression when token limits are approached.
             - total_matches (int): Number of matching commits found
             - error (str): Error message if failed
         """
-        with BranchLogger(branch) as logger:
-            logger.info(f"Tool called: search_note_history (keywords={keywords}, limit={limit})")
-            try:
-                with GitNoteManager(branch) as manager:
-                    result = await asyncio.to_thread(manager.search_history, keywords, limit)
-                    logger.info(f"Found {result.total_matches} matches")
-
-                    return SearchResult(
-                        success=True,
-                        commits=result.commits,
-                        total_matches=result.total_matches,
-                    )
-            except Exception as e:
-                logger.error(f"Failed to search history: {e}")
-                return SearchResult(
-                    success=False,
-                    error=str(e),
-                )
+        logger.info(f"Tool called: search_note_history (keywords={keywords}, limit={limit})")
+        try:
+            result = await run_with_manager(GitNoteManager.search_history, keywords, limit)
+            logger.info(f"Found {result.total_matches} matches")
+
+            return SearchResult(
+                success=True,
+                commits=result.commits,
+                total_matches=result.total_matches,
+            )
+        except Exception as e:
+            logger.error(f"Failed to search history: {e}")
+            return SearchResult(
+                success=False,
+                error=str(e),
+            )
 
     return mcp
@@ -2,7 +2,7 @@
 
 import argparse
 
-from gnote.config import GnoteConfig
+from gnote.config import CONFIG_KEYS, GnoteConfig
 from gnote.config_manager import ConfigManager
 from gnote.logger import BranchLogger
 from gnote.mcp import setup_mcp
@@ -49,26 +49,22 @@ Config Override Examples:
         if args.config_override:
             overrides = {}
             for override in args.config_override:
-                if "=" not in override:
+                key, sep, value = override.partition("=")
+                if not sep:
                     logger.error(f"Invalid override format: {override} (expected key=value)")
                     raise ValueError(f"Invalid override format: {override}")
-                key, value = override.split("=", 1)
                 key = key.strip()
-                value = value.strip()
 
-                if key == "token_limit":
-                    overrides[key] = int(value)
-                elif key == "token_approach":
-                    overrides[key] = value
-                else:
+                if key not in CONFIG_KEYS:
                     logger.warning(f"Unknown config key: {key}")
                     continue
+                overrides[key] = GnoteConfig.validate_field(key, value.strip())
 
             config = GnoteConfig(**{**config.model_dump(), **overrides})
             logger.info(f"Config overrides applied: {overrides}")
 
-        logger.info(f"Active config: {config.model_dump_json()}")
-
+        # setup_mcp logs the serialized config it is given; dumping it here too
+        # would serialize the same model twice on every start.
         try:
             mcp_server = setup_mcp(
                 args.branch,
@@ -13,6 +13,8 @@ The chardiv4 approach is intentionally simple to avoid external dependencies
 and works well enough for token pressure monitoring.
 """
 
+from collections.abc import Callable
+
 from gnote.config import TokenApproach
 
 
@@ -30,9 +32,9 @@ class TokenCounter:
         """
         if approach != TokenApproach.CHARDIV4:
             raise ValueError(f"Only chardiv4 supported, got: {approach.value}")
-        self.divisor = 4
 
-    def count(self, text: str) -> int:
+    @staticmethod
+    def count(text: str) -> int:
         """Count tokens in text.
 
         Args:
@@ -41,7 +43,35 @@ class TokenCounter:
         Returns:
             Estimated token count (len(text) // 4)
         """
-        return len(text) // self.divisor
+        return len(text) >> 2
+
+    def get_count_fn(self) -> Callable[[str], int]:
+        """Get a count function specialized for the configured approach.
+
+        The approach is fixed for the lifetime of the counter, so callers on hot
+        paths can bind this once instead of going through count() every time.
+
+        Returns:
+            Function returning the estimated token count for a text
+        """
+        return self.count
+
+    def get_pressure_fn(self, limit: int) -> Callable[[int], float]:
+        """Get a pressure function specialized for a fixed token limit.
+
+        Args:
+            limit: Maximum token limit
+
+        Returns:
+            Function returning token_pressure_percentage as calculate_pressure does
+        """
+        if limit <= 0:
+            return lambda count: 0.0
+
+        def pressure(count: int) -> float:
+            return round(count / limit, 4)
+
+        return pressure
 
     def calculate_pressure(self, count: int, limit: int) -> dict[str, int | float]:
         """Calculate token pressure metrics.
@@ -1,22 +1,46 @@
 """Pytest configuration and fixtures."""
 
 import shutil
-import tempfile
 from collections.abc import Generator
 from pathlib import Path
 
 import pytest
-from pytest import MonkeyPatch
+from pytest import MonkeyPatch, TempPathFactory
+
+from gnote.config_manager import ConfigManager
+from gnote.git_manager import GitNoteManager
+
+
+@pytest.fixture(scope="session")
+def _gnote_template(tmp_path_factory: TempPathFactory) -> Path:
+    """Build one initialized gnote home that every test copies from."""
+    root = tmp_path_factory.mktemp("gnote-template")
+    gnote_home = root / ".gnote"
+    with MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(root))
+        mp.setenv("USERPROFILE", str(root))
+        mp.setattr(ConfigManager, "GNOTE_HOME", gnote_home)
+        mp.setattr(ConfigManager, "REPO_PATH", gnote_home / "repo")
+        with GitNoteManager("master"):
+            pass
+    return gnote_home
 
 
 @pytest.fixture
-def temp_gnote_home(monkeypatch: MonkeyPatch) -> Generator[Path]:
-    """Create a temporary .gnote directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        gnote_home = Path(tmpdir) / ".gnote"
-        gnote_home.mkdir()
-        monkeypatch.setenv("HOME", tmpdir)
-        monkeypatch.setenv("USERPROFILE", tmpdir)
-        yield gnote_home
-        if gnote_home.exists():
-            shutil.rmtree(gnote_home, ignore_errors=True)
+def temp_gnote_home(_gnote_template: Path, tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """Create a temporary .gnote directory holding a copy of the template repo."""
+    gnote_home = tmp_path / ".gnote"
+    shutil.copytree(_gnote_template, gnote_home, ignore=shutil.ignore_patterns("logs"))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    return gnote_home
+
+
+@pytest.fixture(autouse=True)
+def _patch_config_paths(temp_gnote_home: Path) -> Generator[None]:
+    """Point ConfigManager at the per-test gnote home."""
+    saved = ConfigManager.GNOTE_HOME, ConfigManager.REPO_PATH
+    ConfigManager.GNOTE_HOME = temp_gnote_home
+    ConfigManager.REPO_PATH = temp_gnote_home / "repo"
+    yield
+    ConfigManager.GNOTE_HOME, ConfigManager.REPO_PATH = saved
@@ -1,8 +1,11 @@
 """Tests for CLI commands."""
 
 import argparse
+import io
 from pathlib import Path
 
+import pytest
+from git import Repo
 from pytest import CaptureFixture, MonkeyPatch
 
 from gnote.cli import (
@@ -13,136 +16,137 @@ from gnote.cli import (
     cmd_read,
     cmd_snapshot,
     cmd_update,
+    cmd_validate,
+    main,
+    validate_branch_name,
 )
 from gnote.config_manager import ConfigManager
 from gnote.git_manager import GitNoteManager
 
+# Commands never mutate their Namespace, so argument-free ones share these.
+NO_ARGS = argparse.Namespace()
+HISTORY_ARGS = argparse.Namespace(limit=10, starting_after=None)
 
-def test_cli_read(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
-) -> None:
-    """Test CLI read command."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
 
-    with GitNoteManager("master") as manager:
-        manager.write_note("Test content", "Initial")
+def read_head(repo_path: Path) -> tuple[str, str]:
+    """Read the note and SHA at HEAD straight from the repository, without a manager."""
+    with Repo(repo_path) as repo:
+        commit = repo.head.commit
+        blob = commit.tree / ConfigManager.NOTE_FILE
+        return blob.data_stream.read().decode("utf-8"), commit.hexsha
 
-    args = argparse.Namespace()
-    cmd_read(args)
-    captured = capsys.readouterr()
-    assert "Test content" in captured.out
 
+@pytest.fixture
+def initialized_repo(temp_gnote_home: Path) -> Path:
+    """Seed the master branch with an initial note."""
+    with GitNoteManager("master") as manager:
+        manager.write_note("Initial", "Initial")
+    return temp_gnote_home
 
-def test_cli_update(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
-) -> None:
-    """Test CLI update command."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
 
+def test_cli_read(temp_gnote_home: Path, capsys: CaptureFixture[str]) -> None:
+    """Test CLI read command."""
     with GitNoteManager("master") as manager:
-        manager.write_note("Initial", "Initial")
+        manager.write_note("Test content", "Initial")
+
+    cmd_read(NO_ARGS)
+    assert capsys.readouterr().out == "Test content\n"
 
+
+def test_cli_update(initialized_repo: Path, capsys: CaptureFixture[str]) -> None:
+    """Test CLI update command."""
     args = argparse.Namespace(message="Update test", content="Updated content")
     cmd_update(args)
     captured = capsys.readouterr()
-    assert "✓ Updated note" in captured.out
 
-    with GitNoteManager("master") as manager:
-        content = manager.read_note()
-        assert content == "Updated content"
+    content, sha = read_head(initialized_repo / "repo")
+    assert content == "Updated content"
+    assert captured.out == f"✓ Updated note: {sha:.8s}\n"
 
 
-def test_cli_append(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
-) -> None:
+def test_cli_append(initialized_repo: Path, capsys: CaptureFixture[str]) -> None:
     """Test CLI append command."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
-    with GitNoteManager("master") as manager:
-        manager.write_note("Initial", "Initial")
-
     args = argparse.Namespace(message="Append test", text="Appended")
     cmd_append(args)
     captured = capsys.readouterr()
-    assert "✓ Appended to note" in captured.out
 
-    with GitNoteManager("master") as manager:
-        content = manager.read_note()
-        assert "Initial" in content
-        assert "Appended" in content
+    content, sha = read_head(initialized_repo / "repo")
+    assert content == "Initial\nAppended"
+    assert captured.out == f"✓ Appended to note: {sha:.8s}\n"
 
 
-def test_cli_history(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+def test_cli_append_from_stdin(
+    initialized_repo: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
 ) -> None:
-    """Test CLI history command."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
+    """Test CLI append command reading text from stdin."""
+    piped = "Piped ✓ line\r\nOld Mac line\r" * 20000
+    stdin = io.TextIOWrapper(io.BytesIO(piped.encode("utf-8")), encoding="utf-8")
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    args = argparse.Namespace(message="Append stdin", text=None)
+    cmd_append(args)
+    assert "✓ Appended to note" in capsys.readouterr().out
+
+    content, _ = read_head(initialized_repo / "repo")
+    assert content == "Initial\n" + "Piped ✓ line\nOld Mac line\n" * 20000
+
+
+def test_cli_append_from_text_stdin(
+    initialized_repo: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+) -> None:
+    """Test CLI append reads a stdin replacement that has no binary buffer."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("From StringIO"))
+
+    args = argparse.Namespace(message="Append stdin", text=None)
+    cmd_append(args)
+    assert "✓ Appended to note" in capsys.readouterr().out
+
+    content, _ = read_head(initialized_repo / "repo")
+    assert content == "Initial\nFrom StringIO"
+
 
+def test_cli_history(temp_gnote_home: Path, capsys: CaptureFixture[str]) -> None:
+    """Test CLI history command."""
     with GitNoteManager("master") as manager:
         manager.write_note("Content 1", "Commit 1")
         manager.write_note("Content 2", "Commit 2")
         manager.write_note("Content 3", "Commit 3")
 
-    args = argparse.Namespace(limit=10, starting_after=None)
-    cmd_history(args)
+    cmd_history(HISTORY_ARGS)
     captured = capsys.readouterr()
     assert "Commit 1" in captured.out
     assert "Commit 2" in captured.out
     assert "Commit 3" in captured.out
 
 
-def test_cli_snapshot(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
-) -> None:
+def test_cli_snapshot(temp_gnote_home: Path, capsys: CaptureFixture[str]) -> None:
     """Test CLI snapshot command."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("master") as manager:
         sha = manager.write_note("Snapshot content", "Snapshot commit")
         manager.write_note("Later content", "Later")
+        timestamp = manager.get_snapshot(sha).timestamp
 
     args = argparse.Namespace(sha=sha)
     cmd_snapshot(args)
     captured = capsys.readouterr()
-    assert "Snapshot content" in captured.out
-    assert "Snapshot commit" in captured.out
+    assert captured.out == (
+        f"# Snapshot: {sha}\n# Message: Snapshot commit\n# Time: {timestamp}\n\nSnapshot content\n"
+    )
 
 
-def test_cli_branch_list(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
-) -> None:
+def test_cli_branch_list(temp_gnote_home: Path, capsys: CaptureFixture[str]) -> None:
     """Test CLI branch list command."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("master") as manager:
         manager.write_note("Initial", "Init")
-
-    with GitNoteManager("test-branch") as manager:
+        manager.switch_branch("test-branch")
         manager.write_note("Test", "Test")
 
-    args = argparse.Namespace()
-    cmd_branch_list(args)
-    captured = capsys.readouterr()
-    assert "master" in captured.out
-    assert "test-branch" in captured.out
+    cmd_branch_list(NO_ARGS)
+    assert capsys.readouterr().out == "* master\n  test-branch\n"
 
 
-def test_cli_branch_create(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
-) -> None:
+def test_cli_branch_create(initialized_repo: Path, capsys: CaptureFixture[str]) -> None:
     """Test CLI branch create command."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
-    with GitNoteManager("master") as manager:
-        manager.write_note("Initial", "Init")
-
     args = argparse.Namespace(name="new-branch", from_branch=None)
     cmd_branch_create(args)
     captured = capsys.readouterr()
@@ -151,3 +155,75 @@ def test_cli_branch_create(
     with GitNoteManager("new-branch") as manager:
         content = manager.read_note()
         assert "Initial" in content
+
+
+def test_cli_validate(temp_gnote_home: Path, capsys: CaptureFixture[str]) -> None:
+    """Test validate passes on a full setup and rejects files in place of directories."""
+    for subdir in ("configs", "logs"):
+        (temp_gnote_home / subdir).mkdir(exist_ok=True)
+    ConfigManager.initialize_default()
+
+    cmd_validate(NO_ARGS)
+    assert "✓ All checks passed!" in capsys.readouterr().out
+
+    (temp_gnote_home / "configs").rmdir()
+    (temp_gnote_home / "configs").write_text("")
+    with pytest.raises(SystemExit):
+        cmd_validate(NO_ARGS)
+    assert "~/.gnote/configs does not exist" in capsys.readouterr().out
+
+    ConfigManager.global_config_path().unlink()
+    ConfigManager.global_config_path().mkdir()
+    with pytest.raises(SystemExit):
+        cmd_validate(NO_ARGS)
+    assert f"{ConfigManager.GLOBAL_CONFIG_FILE} cannot be read" in capsys.readouterr().out
+
+
+def test_cli_validate_home_not_directory(
+    tmp_path: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+) -> None:
+    """Test validate reports a regular file at ~/.gnote instead of crashing."""
+    home_file = tmp_path / "gnote-file"
+    home_file.write_text("")
+    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", home_file)
+
+    with pytest.raises(SystemExit):
+        cmd_validate(NO_ARGS)
+    assert "~/.gnote is not a readable directory" in capsys.readouterr().out
+
+
+def test_cli_main_fast_path(
+    temp_gnote_home: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+) -> None:
+    """Test argument-free commands dispatch through main."""
+    with GitNoteManager("master") as manager:
+        manager.write_note("Fast content", "Fast commit")
+
+    monkeypatch.setattr("sys.argv", ["gnote", "read"])
+    main()
+    assert "Fast content" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["gnote", "history"])
+    main()
+    assert "Fast commit" in capsys.readouterr().out
+
+
+def test_cli_main_rejects_invalid_branch(
+    monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+) -> None:
+    """Test invalid branch names are rejected while parsing arguments."""
+    monkeypatch.setattr("sys.argv", ["gnote", "branch", "create", "bad name"])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2
+    assert "invalid branch name" in capsys.readouterr().err
+
+
+def test_validate_branch_name() -> None:
+    """Test branch name validation."""
+    assert validate_branch_name("main") == "main"
+    assert validate_branch_name("agent/task-1.2_b") == "agent/task-1.2_b"
+
+    for invalid in ["", "a" * 256, "has space", "bad..name", "/abs", ".hidden", "HEAD"]:
+        with pytest.raises(ValueError):
+            validate_branch_name(invalid)
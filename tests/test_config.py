@@ -29,3 +29,18 @@ def test_gnote_config_validation() -> None:
 
     with pytest.raises(ValidationError):
         GnoteConfig(token_limit=-100)
+
+
+def test_gnote_config_validate_field() -> None:
+    """Test single-field validation."""
+    import pytest
+    from pydantic import ValidationError
+
+    assert GnoteConfig.validate_field("token_limit", "12000") == 12000
+    assert GnoteConfig.validate_field("token_approach", "chardiv4") == "chardiv4"
+
+    with pytest.raises(ValidationError):
+        GnoteConfig.validate_field("token_limit", "0")
+
+    with pytest.raises(ValidationError):
+        GnoteConfig.validate_field("token_approach", "unknown")
@@ -2,27 +2,24 @@
 
 from pathlib import Path
 
-from gnote.config import TokenApproach
-from gnote.config_manager import ConfigManager
+import pytest
 from pytest import MonkeyPatch
 
+from gnote import config_manager
+from gnote.config import GnoteConfig, TokenApproach
+from gnote.config_manager import ConfigManager
+
 
-def test_config_manager_defaults(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_config_manager_defaults(temp_gnote_home: Path) -> None:
     """Test that ConfigManager loads default config."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     config = ConfigManager.load_for_branch("test")
 
     assert config.token_approach == TokenApproach.CHARDIV4
     assert config.token_limit == 8000
 
 
-def test_config_manager_global_config(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_config_manager_global_config(temp_gnote_home: Path) -> None:
     """Test global config creation and loading."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     config_data: dict[str, str | int] = {"token_limit": 10000}
     ConfigManager.save_branch_override("", config_data)
 
@@ -31,11 +28,8 @@ def test_config_manager_global_config(temp_gnote_home: Path, monkeypatch: Monkey
     assert config.token_limit == 8000
 
 
-def test_config_manager_branch_config(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_config_manager_branch_config(temp_gnote_home: Path) -> None:
     """Test branch-specific config override."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     ConfigManager.initialize_default()
 
     override_data: dict[str, str | int] = {"token_limit": 12000}
@@ -45,11 +39,8 @@ def test_config_manager_branch_config(temp_gnote_home: Path, monkeypatch: Monkey
     assert config.token_limit == 12000
 
 
-def test_config_manager_merge(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_config_manager_merge(temp_gnote_home: Path) -> None:
     """Test config merging between global and branch."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     ConfigManager.initialize_default()
 
     override_data: dict[str, str | int] = {"token_limit": 15000}
@@ -60,11 +51,31 @@ def test_config_manager_merge(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -
     assert config.token_approach == TokenApproach.CHARDIV4
 
 
-def test_get_branch_override(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
-    """Test getting branch override."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
+def test_config_manager_cache_invalidation(temp_gnote_home: Path) -> None:
+    """Test cached configs are refreshed after saving overrides."""
+    ConfigManager.initialize_default()
+    assert ConfigManager.load_for_branch("test").token_limit == 8000
+    assert ConfigManager.load_for_branch("other").token_limit == 8000
+
+    ConfigManager.save_branch_override("test", {"token_limit": 9000})
+    assert ConfigManager.load_for_branch("test").token_limit == 9000
 
+    ConfigManager.save_global(GnoteConfig(token_limit=7000))
+    assert ConfigManager.load_for_branch("other").token_limit == 7000
+
+
+def test_config_manager_load_unvalidated(temp_gnote_home: Path) -> None:
+    """Test unvalidated load matches validated load."""
+    ConfigManager.initialize_default()
+    ConfigManager.save_branch_override("test", {"token_limit": 15000})
+
+    config = ConfigManager.load_for_branch_unvalidated("test")
+    assert config.token_limit == 15000
+    assert config.model_dump_json() == ConfigManager.load_for_branch("test").model_dump_json()
+
+
+def test_get_branch_override(temp_gnote_home: Path) -> None:
+    """Test getting branch override."""
     overrides: dict[str, str | int] = {"token_limit": 12000}
     ConfigManager.save_branch_override("test", overrides)
 
@@ -73,3 +84,27 @@ def test_get_branch_override(temp_gnote_home: Path, monkeypatch: MonkeyPatch) ->
 
     result = ConfigManager.get_branch_override("nonexistent")
     assert result == {}
+
+
+def test_config_manager_json_fallback(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test config files round-trip through the stdlib json fallback."""
+    monkeypatch.setattr(config_manager, "_loads", config_manager._json_loads)
+    monkeypatch.setattr(config_manager, "_dumps", config_manager._json_dumps)
+
+    ConfigManager.save_global(GnoteConfig(token_limit=7000))
+    ConfigManager.save_branch_override("test", {"token_limit": 9000})
+
+    assert ConfigManager.global_config_path().read_bytes() == config_manager._json_dumps(
+        GnoteConfig(token_limit=7000).model_dump()
+    )
+    assert ConfigManager.load_for_branch("test").token_limit == 9000
+    assert ConfigManager.get_branch_override("test") == {"token_limit": 9000}
+
+
+def test_config_manager_orjson_matches_json() -> None:
+    """Test orjson and the json fallback write identical config bytes."""
+    pytest.importorskip("orjson")
+
+    for data in [{}, GnoteConfig().model_dump(), {"token_limit": 9000, "token_approach": "x"}]:
+        assert config_manager._dumps(data) == config_manager._json_dumps(data)
+        assert config_manager._loads(config_manager._dumps(data)) == data
@@ -1,28 +1,24 @@
 """Tests for git_manager module."""
 
+from datetime import datetime
 from pathlib import Path
 
-from pytest import MonkeyPatch
+import pytest
 
+from gnote import git_manager
 from gnote.config_manager import ConfigManager
 from gnote.git_manager import GitNoteManager
 
 
-def test_git_manager_initialization(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_git_manager_initialization(temp_gnote_home: Path) -> None:
     """Test GitNoteManager initialization."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         assert manager.branch == "test"
         assert (temp_gnote_home / "repo" / ".git").exists()
 
 
-def test_git_manager_write_and_read(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_git_manager_write_and_read(temp_gnote_home: Path) -> None:
     """Test writing and reading note."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         content = "Test note content"
         commit_sha = manager.write_note(content, "Test commit")
@@ -33,11 +29,8 @@ def test_git_manager_write_and_read(temp_gnote_home: Path, monkeypatch: MonkeyPa
         assert read_content == content
 
 
-def test_git_manager_append(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_git_manager_append(temp_gnote_home: Path) -> None:
     """Test appending to note."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         initial_content = "Initial content"
         manager.write_note(initial_content, "Initial commit")
@@ -50,15 +43,16 @@ def test_git_manager_append(temp_gnote_home: Path, monkeypatch: MonkeyPatch) ->
         assert read_content.replace("\r\n", "\n") == expected
 
 
-def test_git_manager_history(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_git_manager_history(temp_gnote_home: Path) -> None:
     """Test getting commit history."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
-        manager.write_note("Content 1", "Commit 1")
-        manager.write_note("Content 2", "Commit 2")
-        manager.write_note("Content 3", "Commit 3")
+        shas = manager.write_notes(
+            [
+                ("Content 1", "Commit 1"),
+                ("Content 2", "Commit 2"),
+                ("Content 3", "Commit 3"),
+            ]
+        )
 
         history = manager.get_history(10, None)
 
@@ -66,13 +60,11 @@ def test_git_manager_history(temp_gnote_home: Path, monkeypatch: MonkeyPatch) ->
         assert history.commits[0].message == "Commit 3"
         assert history.commits[1].message == "Commit 2"
         assert history.commits[2].message == "Commit 1"
+        assert [c.sha for c in history.commits[:3]] == shas[::-1]
 
 
-def test_git_manager_snapshot(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_git_manager_snapshot(temp_gnote_home: Path) -> None:
     """Test getting snapshot from commit."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         content1 = "Content 1"
         sha1 = manager.write_note(content1, "Commit 1")
@@ -84,17 +76,18 @@ def test_git_manager_snapshot(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -
         assert snapshot.commit_message == "Commit 1"
 
 
-def test_git_manager_search_history(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_git_manager_search_history(temp_gnote_home: Path) -> None:
     """Test searching commit history by keywords."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         # Create commits with different content and messages
-        manager.write_note("Python code here", "Add python implementation")
-        manager.write_note("JavaScript code here", "Add javascript feature")
-        manager.write_note("Rust code here", "Add rust module")
-        manager.write_note("More python examples", "Update documentation")
+        manager.write_notes(
+            [
+                ("Python code here", "Add python implementation"),
+                ("JavaScript code here", "Add javascript feature"),
+                ("Rust code here", "Add rust module"),
+                ("More python examples", "Update documentation"),
+            ]
+        )
 
         # Search for "python" - should match commit message and content
         result = manager.search_history(["python"])
@@ -117,3 +110,197 @@ def test_git_manager_search_history(temp_gnote_home: Path, monkeypatch: MonkeyPa
         # Search with limit
         result = manager.search_history(["code"], limit=2)
         assert len(result.commits) <= 2
+
+
+def test_git_manager_create_branch(temp_gnote_home: Path) -> None:
+    """Test creating branches from the current or another branch."""
+    with GitNoteManager("test") as manager:
+        manager.write_note("Test content", "Test commit")
+
+        assert manager.create_branch("child") == "child"
+        assert manager.create_branch("grandchild", from_branch="child") == "grandchild"
+
+        with pytest.raises(ValueError):
+            manager.create_branch("child")
+
+        with pytest.raises(ValueError):
+            manager.create_branch("orphan", from_branch="missing")
+
+    with GitNoteManager("grandchild") as manager:
+        assert manager.read_note() == "Test content"
+
+    assert {"test", "child", "grandchild"} <= set(GitNoteManager.list_branches())
+
+
+def test_git_manager_write_then_checkout(temp_gnote_home: Path) -> None:
+    """Test writes to the checked-out branch leave a clean checkout behind."""
+    with GitNoteManager("master") as manager:
+        manager.write_note("Master content", "Master")
+        assert not manager.repo.is_dirty()
+        manager.switch_branch("feature")
+        manager.write_note("Feature content", "Feature")
+
+        GitNoteManager.checkout_branch("feature")
+        assert (temp_gnote_home / "repo" / "note").read_text() == "Feature content"
+
+        manager.write_notes([("Feature 2", "Feature 2"), ("Feature 3", "Feature 3")])
+        assert not manager.repo.is_dirty()
+
+        GitNoteManager.checkout_branch("master")
+        assert (temp_gnote_home / "repo" / "note").read_text() == "Master content"
+
+
+def test_git_manager_switch_branch(temp_gnote_home: Path) -> None:
+    """Test one manager can move between branches without reopening the repo."""
+    with GitNoteManager("test") as manager:
+        manager.write_note("Test content", "Test commit")
+        repo = manager.repo
+
+        manager.switch_branch("other")
+        assert manager.get_current_branch() == "other"
+        assert manager.repo is repo
+        manager.write_note("Other content", "Other commit")
+
+        manager.switch_branch("test")
+        assert manager.read_note() == "Test content"
+
+        with manager.bulk(), pytest.raises(RuntimeError):
+            manager.switch_branch("other")
+
+    with GitNoteManager("other") as manager:
+        assert manager.read_note() == "Other content"
+
+
+def test_git_manager_blob_cache(temp_gnote_home: Path) -> None:
+    """Test identical note blobs are decoded once across snapshots and search."""
+    with GitNoteManager("test") as manager:
+        sha1 = manager.write_note("Shared content", "First")
+        sha2 = manager.write_note("Shared content", "Second")
+
+        assert manager.get_snapshot(sha1).content == "Shared content"
+        assert manager.get_snapshot(sha2).content == "Shared content"
+        assert len(manager._blob_cache) == 1
+
+        result = manager.search_history(["shared"])
+        assert [c.sha for c in result.commits] == [sha2, sha1]
+
+
+def test_git_manager_write_keeps_tree_entries(temp_gnote_home: Path) -> None:
+    """Test writing a note replaces only the note entry of the parent tree."""
+    with GitNoteManager("test") as manager:
+        (temp_gnote_home / "repo" / "extra.txt").write_text("extra")
+        manager.repo.index.add(["extra.txt"])
+        head = manager.repo.heads.test
+        head.commit = manager.repo.index.commit(
+            "Add extra", parent_commits=[head.commit], head=False
+        )
+
+        manager.write_note("New content", "Update")
+
+        tree = head.commit.tree
+        assert sorted(entry.path for entry in tree) == ["extra.txt", ConfigManager.NOTE_FILE]
+        assert manager.read_note() == "New content"
+        manager.repo.git.fsck()
+
+
+def test_git_manager_shared_repo_sees_new_branches(temp_gnote_home: Path) -> None:
+    """Test branch lookups reuse one repository without going stale."""
+    with GitNoteManager("test") as manager:
+        branches = GitNoteManager.list_branches()
+        assert "test" in branches
+
+        manager.create_branch("other")
+        GitNoteManager.checkout_branch("other")
+
+        assert GitNoteManager.list_branches() == sorted([*branches, "other"])
+        assert GitNoteManager.get_active_branch() == "other"
+
+
+def test_git_manager_shared_repo_keeps_latest_path(temp_gnote_home: Path, tmp_path: Path) -> None:
+    """Test the shared repository cache closes the previous path's repository."""
+    first = git_manager._shared_repo(ConfigManager.REPO_PATH)
+    assert git_manager._shared_repo(ConfigManager.REPO_PATH) is first
+
+    other_path = tmp_path / "other"
+    first.clone(other_path)
+    other = git_manager._shared_repo(other_path)
+
+    assert other is not first
+    assert list(git_manager._shared_repos) == [other_path]
+
+
+def test_git_manager_history_timestamp_format(temp_gnote_home: Path) -> None:
+    """Test commit timestamps are local ISO 8601 strings."""
+    with GitNoteManager("test") as manager:
+        sha = manager.write_note("Content", "Commit")
+        commit = manager.repo.commit(sha)
+
+        expected = datetime.fromtimestamp(commit.committed_date).isoformat()
+        assert manager.get_history(limit=1).commits[0].timestamp == expected
+        assert manager.get_snapshot(sha).timestamp == expected
+
+
+def test_git_manager_search_history_non_ascii(temp_gnote_home: Path) -> None:
+    """Test content search folds case for ASCII and non-ASCII keywords."""
+    with GitNoteManager("test") as manager:
+        sha = manager.write_note("Ünïcode NOTES", "Update")
+
+        assert [c.sha for c in manager.search_history(["notes"]).commits] == [sha]
+        assert [c.sha for c in manager.search_history(["ünïcode"]).commits] == [sha]
+        assert manager.search_history(["missing"]).commits == []
+
+    # "k" folds to KELVIN SIGN; an uncached blob must match like a cached one.
+    with GitNoteManager("test") as manager:
+        kelvin = manager.write_note("\u212a note", "Update")
+    with GitNoteManager("test") as manager:
+        assert kelvin in [c.sha for c in manager.search_history(["k"]).commits]
+        assert kelvin in [c.sha for c in manager.search_history(["k"]).commits]
+
+
+def test_git_manager_history_pagination(temp_gnote_home: Path) -> None:
+    """Test paging through history keeps totals current across writes."""
+    with GitNoteManager("test") as manager:
+        manager.write_note("Content 1", "Commit 1")
+        initial_total = manager.get_history(1).total_commits
+
+        manager.write_note("Content 2", "Commit 2")
+        manager.write_note("Content 3", "Commit 3")
+
+        first = manager.get_history(2)
+        assert first.total_commits == initial_total + 2
+        assert [c.message for c in first.commits] == ["Commit 3", "Commit 2"]
+        assert first.has_more
+
+        rest = manager.get_history(first.total_commits, first.commits[-1].sha)
+        assert rest.commits[0].message == "Commit 1"
+        assert len(rest.commits) == first.total_commits - 2
+        assert not rest.has_more
+
+
+def test_git_manager_append_uncached(temp_gnote_home: Path) -> None:
+    """Test appending to a note whose content is not cached by this manager."""
+    with GitNoteManager("test") as manager:
+        manager.write_note("Ünïcode line\n", "Initial commit")
+
+    with GitNoteManager("test") as manager:
+        manager.append_note("Appended", "Append commit")
+        assert manager.read_note() == "Ünïcode line\nAppended"
+
+
+def test_git_manager_bulk_writes(temp_gnote_home: Path) -> None:
+    """Test bulk writes chain commits and move the branch once on exit."""
+    with GitNoteManager("test") as manager:
+        before = manager.repo.heads.test.commit
+
+        with manager.bulk():
+            manager.write_note("One", "Commit 1")
+            manager.append_note("Two", "Commit 2")
+            last = manager.write_note("Three", "Commit 3")
+
+            assert manager.repo.heads.test.commit == before
+            assert manager.read_note() == "Three"
+
+        assert manager.repo.heads.test.commit.hexsha == last
+        history = manager.get_history(3)
+        assert [c.message for c in history.commits] == ["Commit 3", "Commit 2", "Commit 1"]
+        assert manager.get_snapshot(history.commits[1].sha).content == "One\nTwo"
@@ -2,31 +2,41 @@
 
 import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
-from pytest import MonkeyPatch
+from mcp.server.fastmcp import FastMCP
 
 from gnote.config import GnoteConfig
-from gnote.config_manager import ConfigManager
 from gnote.git_manager import GitNoteManager
 from gnote.mcp import setup_mcp
 
 
-def test_mcp_setup(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
-    """Test MCP server setup and read_note tool."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
+@pytest.fixture
+def mcp_server(temp_gnote_home: Path) -> FastMCP:
+    """Build a "test" branch server against the per-test gnote home."""
+    return setup_mcp("test")
+
+
+@pytest.fixture
+def mcp_tools(mcp_server: FastMCP) -> SimpleNamespace:
+    """Expose the server's tool functions as attributes."""
+    return SimpleNamespace(**{tool.name: tool.fn for tool in mcp_server._tool_manager.list_tools()})
+
 
+@pytest.mark.asyncio
+async def test_mcp_setup(mcp_server: FastMCP, mcp_tools: SimpleNamespace) -> None:
+    """Test MCP server setup and read_note tool."""
     initial_content = "Initial test content"
     with GitNoteManager("test") as manager:
         manager.write_note(initial_content, "Initial commit")
 
-    mcp = setup_mcp("test")
+    assert mcp_server is not None
+    assert mcp_server.name == "gnote"
+    for tool in mcp_server._tool_manager.list_tools():
+        assert tool.output_schema is not None, tool.name
 
-    assert mcp is not None
-    assert mcp.name == "gnote"
-
-    result = asyncio.run(mcp._tool_manager._tools["read_note"].fn())
+    result = await mcp_tools.read_note()
     assert result.success is True
     assert result.content == initial_content
     assert result.token_count > 0
@@ -34,18 +44,13 @@ def test_mcp_setup(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_mcp_read_note_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+async def test_mcp_read_note_tool(mcp_tools: SimpleNamespace) -> None:
     """Test read_note tool actually works."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     test_content = "Test note content"
     with GitNoteManager("test") as manager:
         manager.write_note(test_content, "Initial")
 
-    mcp = setup_mcp("test")
-    read_note_tool = mcp._tool_manager._tools["read_note"]
-    result = await read_note_tool.fn()
+    result = await mcp_tools.read_note()
 
     assert result.success is True
     assert result.content == test_content
@@ -54,69 +59,54 @@ async def test_mcp_read_note_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatc
 
 
 @pytest.mark.asyncio
-async def test_mcp_update_note_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+async def test_mcp_update_note_tool(mcp_tools: SimpleNamespace) -> None:
     """Test update_note tool actually works."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         manager.write_note("Initial content", "Initial")
 
-    mcp = setup_mcp("test")
-    update_note_tool = mcp._tool_manager._tools["update_note"]
-
     new_content = "Updated content"
-    result = await update_note_tool.fn(new_content, "Update test")
+    result = await mcp_tools.update_note(new_content, "Update test")
 
     assert result.success is True
     assert result.new_token_count > 0
     assert result.error == ""
 
-    read_note_tool = mcp._tool_manager._tools["read_note"]
-    read_result = await read_note_tool.fn()
+    read_result = await mcp_tools.read_note()
     assert read_result.content == new_content
 
 
 @pytest.mark.asyncio
-async def test_mcp_append_to_note_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+async def test_mcp_append_to_note_tool(mcp_tools: SimpleNamespace) -> None:
     """Test append_to_note tool actually works."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     initial_content = "Initial content"
     with GitNoteManager("test") as manager:
         manager.write_note(initial_content, "Initial")
 
-    mcp = setup_mcp("test")
-    append_note_tool = mcp._tool_manager._tools["append_to_note"]
-
     append_text = "\nAppended text"
-    result = await append_note_tool.fn(append_text, "Append test")
+    result = await mcp_tools.append_to_note(append_text, "Append test")
 
     assert result.success is True
     assert result.token_delta > 0
     assert result.error == ""
 
-    read_note_tool = mcp._tool_manager._tools["read_note"]
-    read_result = await read_note_tool.fn()
+    read_result = await mcp_tools.read_note()
     assert initial_content in read_result.content
     assert append_text in read_result.content
 
 
 @pytest.mark.asyncio
-async def test_mcp_history_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+async def test_mcp_history_tool(mcp_tools: SimpleNamespace) -> None:
     """Test get_note_history tool actually works."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
-        manager.write_note("Content 1", "First commit")
-        manager.write_note("Content 2", "Second commit")
-        manager.write_note("Content 3", "Third commit")
+        manager.write_notes(
+            [
+                ("Content 1", "First commit"),
+                ("Content 2", "Second commit"),
+                ("Content 3", "Third commit"),
+            ]
+        )
 
-    mcp = setup_mcp("test")
-    history_tool = mcp._tool_manager._tools["get_note_history"]
-    result = await history_tool.fn(limit=10)
+    result = await mcp_tools.get_note_history(limit=10)
 
     assert result.success is True
     assert len(result.commits) == 4
@@ -128,19 +118,41 @@ async def test_mcp_history_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatch)
 
 
 @pytest.mark.asyncio
-async def test_mcp_search_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
-    """Test search_note_history tool actually works."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
+async def test_mcp_history_tool_with_content(mcp_tools: SimpleNamespace) -> None:
+    """Test get_note_history returns requested snapshots in the same call."""
+    with GitNoteManager("test") as manager:
+        first_sha = manager.write_note("Content 1", "First commit")
+        manager.write_note("Content 2", "Second commit")
+
+    result = await mcp_tools.get_note_history(
+        limit=3, include_content_for=[first_sha, "0" * 40, "master~1"]
+    )
 
+    assert result.success is True
+    assert result.snapshots[first_sha].content == "Content 1"
+    assert result.snapshots[first_sha].commit_message == "First commit"
+    assert result.snapshots["0" * 40].success is False
+    assert result.snapshots["master~1"].success is False
+    assert "hexadecimal" in result.snapshots["master~1"].error
+
+    result = await mcp_tools.get_note_history(limit=1, include_content_for=[first_sha] * 2)
+    assert result.success is False
+    assert "include_content_for" in result.error
+
+
+@pytest.mark.asyncio
+async def test_mcp_search_tool(mcp_tools: SimpleNamespace) -> None:
+    """Test search_note_history tool actually works."""
     with GitNoteManager("test") as manager:
-        manager.write_note("Python code here", "Add Python")
-        manager.write_note("JavaScript code here", "Add JavaScript")
-        manager.write_note("More Python code", "More Python")
+        manager.write_notes(
+            [
+                ("Python code here", "Add Python"),
+                ("JavaScript code here", "Add JavaScript"),
+                ("More Python code", "More Python"),
+            ]
+        )
 
-    mcp = setup_mcp("test")
-    search_tool = mcp._tool_manager._tools["search_note_history"]
-    result = await search_tool.fn(keywords=["Python"], limit=100)
+    result = await mcp_tools.search_note_history(keywords=["Python"], limit=100)
 
     assert result.success is True
     assert result.total_matches == 2
@@ -148,11 +160,41 @@ async def test_mcp_search_tool(temp_gnote_home: Path, monkeypatch: MonkeyPatch)
     assert result.error == ""
 
 
-def test_mcp_setup_with_config_override(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
-    """Test MCP server setup with config override."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
+@pytest.mark.asyncio
+async def test_mcp_tools_share_manager(mcp_tools: SimpleNamespace) -> None:
+    """Test tool calls reuse one manager and still see writes made elsewhere."""
+    with GitNoteManager("test") as manager:
+        manager.write_note("First", "Initial")
+
+    results = await asyncio.gather(
+        mcp_tools.append_to_note(text="Second", commit_message="Append"),
+        mcp_tools.read_note(),
+    )
+    assert all(result.success for result in results)
 
+    with GitNoteManager("test") as manager:
+        manager.write_note("Outside", "External write")
+
+    result = await mcp_tools.read_note()
+    assert result.content == "Outside"
+
+
+@pytest.mark.asyncio
+async def test_mcp_tools_reject_invalid_arguments(mcp_tools: SimpleNamespace) -> None:
+    """Test invalid tool arguments are reported through the error field."""
+    history = await mcp_tools.get_note_history(limit=0)
+    assert history.success is False
+    assert history.error == "limit must be positive"
+
+    short = await mcp_tools.get_snapshot(commit_sha="abc")
+    assert short.error == "commit_sha must be at least 7 characters"
+
+    not_hex = await mcp_tools.get_snapshot(commit_sha="xyz12345")
+    assert not_hex.error == "commit_sha must be a valid hexadecimal hash"
+
+
+def test_mcp_setup_with_config_override(temp_gnote_home: Path) -> None:
+    """Test MCP server setup with config override."""
     with GitNoteManager("test") as manager:
         manager.write_note("Initial content", "Initial")
 
@@ -174,11 +216,8 @@ def test_mcp_setup_with_config_override(temp_gnote_home: Path, monkeypatch: Monk
     assert expected_tools.issubset(tool_names)
 
 
-def test_mcp_with_different_branches(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_mcp_with_different_branches(temp_gnote_home: Path) -> None:
     """Test MCP server works with different branches."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("master") as manager:
         manager.write_note("Master content", "Initial")
 
@@ -198,15 +237,16 @@ def test_mcp_with_different_branches(temp_gnote_home: Path, monkeypatch: MonkeyP
     assert tool_names_master == tool_names_develop
 
 
-def test_mcp_note_manager_cleanup(temp_gnote_home: Path, monkeypatch: MonkeyPatch) -> None:
+def test_mcp_note_manager_cleanup(temp_gnote_home: Path) -> None:
     """Test that MCP tools properly use note managers."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
-        manager.write_note("Test content", "Initial")
-        manager.write_note("Update 1", "Update 1")
-        manager.write_note("Update 2", "Update 2")
+        manager.write_notes(
+            [
+                ("Test content", "Initial"),
+                ("Update 1", "Update 1"),
+                ("Update 2", "Update 2"),
+            ]
+        )
 
     mcp = setup_mcp("test")
 
@@ -218,13 +258,8 @@ def test_mcp_note_manager_cleanup(temp_gnote_home: Path, monkeypatch: MonkeyPatc
     assert "get_note_history" in tool_names
 
 
-def test_mcp_setup_with_guidance_tool_enabled(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch
-) -> None:
+def test_mcp_setup_with_guidance_tool_enabled(temp_gnote_home: Path) -> None:
     """Test MCP server setup with guidance tool enabled."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         manager.write_note("Initial content", "Initial")
 
@@ -237,13 +272,8 @@ def test_mcp_setup_with_guidance_tool_enabled(
     assert "guidance" in tool_names
 
 
-def test_mcp_setup_with_guidance_tool_disabled(
-    temp_gnote_home: Path, monkeypatch: MonkeyPatch
-) -> None:
+def test_mcp_setup_with_guidance_tool_disabled(temp_gnote_home: Path) -> None:
     """Test MCP server setup with guidance tool disabled (default)."""
-    monkeypatch.setattr(ConfigManager, "GNOTE_HOME", temp_gnote_home)
-    monkeypatch.setattr(ConfigManager, "REPO_PATH", temp_gnote_home / "repo")
-
     with GitNoteManager("test") as manager:
         manager.write_note("Initial content", "Initial")
 
@@ -1,31 +1,44 @@
 """Tests for token_counter module."""
 
+import pytest
+
 from gnote.config import TokenApproach
 from gnote.token_counter import TokenCounter
 
 
-def test_token_counter_chardiv4() -> None:
+@pytest.fixture(scope="module")
+def counter() -> TokenCounter:
+    """Create one chardiv4 counter for the module."""
+    return TokenCounter(TokenApproach.CHARDIV4)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"), [("", 0), ("test", 1), ("hello world", 2), ("a" * 100, 25)]
+)
+def test_token_counter_chardiv4(counter: TokenCounter, text: str, expected: int) -> None:
     """Test token counting with chardiv4 approach."""
-    counter = TokenCounter(TokenApproach.CHARDIV4)
+    assert counter.count(text) == expected
 
-    assert counter.count("") == 0
-    assert counter.count("test") == 1
-    assert counter.count("hello world") == 2
-    assert counter.count("a" * 100) == 25
 
+def test_token_counter_count_fn(counter: TokenCounter) -> None:
+    """Test specialized count function matches count."""
+    count_tokens = counter.get_count_fn()
 
-def test_calculate_pressure() -> None:
-    """Test token pressure calculation."""
-    counter = TokenCounter(TokenApproach.CHARDIV4)
+    for text in ["", "test", "hello world", "a" * 100]:
+        assert count_tokens(text) == counter.count(text)
 
-    result = counter.calculate_pressure(100, 1000)
-    assert result["token_pressure_percentage"] == 0.1
 
-    result = counter.calculate_pressure(500, 1000)
-    assert result["token_pressure_percentage"] == 0.5
+@pytest.mark.parametrize(("count", "expected"), [(100, 0.1), (500, 0.5), (0, 0.0), (1000, 1.0)])
+def test_calculate_pressure(counter: TokenCounter, count: int, expected: float) -> None:
+    """Test token pressure calculation."""
+    result = counter.calculate_pressure(count, 1000)
+    assert result["token_pressure_percentage"] == expected
 
-    result = counter.calculate_pressure(0, 1000)
-    assert result["token_pressure_percentage"] == 0.0
 
-    result = counter.calculate_pressure(1000, 1000)
-    assert result["token_pressure_percentage"] == 1.0
+def test_pressure_fn(counter: TokenCounter) -> None:
+    """Test specialized pressure function matches calculate_pressure."""
+    for limit in [0, 7, 1000]:
+        pressure = counter.get_pressure_fn(limit)
+        for count in [0, 1, 100, 1000, 1234]:
+            expected = counter.calculate_pressure(count, limit)["token_pressure_percentage"]
+            assert pressure(count) == expected